@@ -6,8 +6,27 @@ Menghapus sidebar dan struktur HTML, hanya keep content.
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Pola regex di-compile sekali di level modul
+# (scan dilakukan di level bytes, template HTML di sini berbasis ASCII)
+BOUNDARY_RE = re.compile(rb'<main|<div class="main"|<nav class="sidebar"|</nav>|</main>')
+LEADING_WS_RE = re.compile(rb'\s*')
+
+# Kerangka template Django (kurung kurawal tag Django di-escape untuk str.format)
+TEMPLATE_NO_STYLE = (
+    '{{% extends "base.html" %}}\n\n'
+    '{{% block title %}}{title}{{% endblock %}}\n\n'
+    '{{% block content %}}\n{content}\n{{% endblock %}}\n'
+)
+TEMPLATE_WITH_STYLE = (
+    '{{% extends "base.html" %}}\n\n'
+    '{{% block title %}}{title}{{% endblock %}}\n\n'
+    '{{% block extra_head %}}\n<style>\n{style}\n</style>\n{{% endblock %}}\n\n'
+    '{{% block content %}}\n{content}\n{{% endblock %}}\n'
+)
+
 templates_dir = Path(r'c:\Users\Dea\OneDrive\Documents\kuliah\TA\data\ta-dea\glod_app\templates\glod_app')
 
 files_to_convert = {
@@ -20,99 +39,149 @@ files_to_convert = {
     'uniprot_index.html': 'UniProt - GLOD Community Detector',
 }
 
-def extract_content_and_style(html_content):
-    """Extract style dan content dari HTML file."""
+
+def _specialize_templates(title):
+    """Tanam title ke kerangka template sekali per file (with_style, no_style)."""
+    escaped = title.replace('{', '{{').replace('}', '}}')
+    return (
+        TEMPLATE_WITH_STYLE.replace('{title}', escaped),
+        TEMPLATE_NO_STYLE.replace('{title}', escaped),
+    )
+
+
+# Daftar file sudah fix, jadi kerangka per file disiapkan sekali di level modul
+specialized_templates = {
+    filename: _specialize_templates(title) for filename, title in files_to_convert.items()
+}
+
+
+def _strip_leading_tag(raw: bytes, pos: int, end: int, prefix: bytes) -> int:
+    """Lewati tag pembuka di raw[pos:end] (sampai '>' pertama) jika diawali prefix."""
+    if raw.startswith(prefix, pos, end):
+        gt = raw.find(b'>', pos, end)
+        if gt != -1:
+            return gt + 1
+    return pos
+
+
+def _extract_styles(raw: bytes) -> list[str]:
+    """Ambil isi semua tag <style> (sudah di-decode dan di-strip)."""
+    # Segmentasi linear dengan partition, tanpa backtracking regex non-greedy
     styles = []
-    content = ""
-    
-    # Extract style tags
-    style_pattern = r'<style[^>]*>(.*?)</style>'
-    for match in re.finditer(style_pattern, html_content, re.DOTALL):
-        styles.append(match.group(1).strip())
-    
-    # Remove old DOCTYPE, html, head, sidebar, container structure
-    # Keep hanya content dalam main/content area
+    rest = raw
+    while True:
+        _, sep, after = rest.partition(b'<style')
+        if not sep:
+            break
+        _, _, after = after.partition(b'>')
+        body, end_sep, rest = after.partition(b'</style>')
+        if not end_sep:
+            break
+        styles.append(body.decode('utf-8').strip())
+    return styles
+
+
+def _find_main_bounds(raw: bytes) -> tuple[int, int, int]:
+    """Cari (main_start, main_end, sidebar_end) dalam satu kali scan; -1 jika tidak ada."""
+    # Scan batas-batas penting sekali jalan, simpan posisi kemunculan pertama
+    first_pos = {}
+    for match in BOUNDARY_RE.finditer(raw):
+        first_pos.setdefault(match.group(), match.start())
+    _get = first_pos.get
+    sidebar_end = _get(b'</nav>', -1)
     
     # Find main content area (setelah sidebar)
     # Pattern: <main atau <div class="main"
-    main_pattern = r'<main[^>]*>|<div[^>]*class="main"[^>]*>'
-    main_start = html_content.find('<main')
+    main_start = _get(b'<main', -1)
     if main_start == -1:
-        main_start = html_content.find('<div class="main"')
-    
+        main_start = _get(b'<div class="main"', -1)
     if main_start == -1:
-        # Fallback: cari div container kedua atau content pertama setelah sidebar
-        main_start = 0
-        # Skip sidebar
-        if '<nav class="sidebar"' in html_content:
-            main_start = html_content.find('</nav>')
+        # Fallback: content pertama setelah sidebar (atau awal file)
+        main_start = sidebar_end if b'<nav class="sidebar"' in first_pos else 0
     
     # Find closing main
-    main_end = html_content.find('</main>')
+    main_end = _get(b'</main>', -1)
     if main_end == -1:
-        main_end = len(html_content) - 200  # Approximate
+        # Approximate: mundur 200 karakter (bukan byte) dari akhir file
+        main_end = len(raw)
+        for _ in range(200):
+            main_end -= 1
+            while main_end > 0 and raw[main_end] & 0xC0 == 0x80:
+                main_end -= 1
+    
+    return main_start, main_end, sidebar_end
+
+
+def _strip_leading_wrappers(raw: bytes, pos: int, end: int) -> int:
+    """Lewati wrapper <div class="container"> / <main> sisa di awal raw[pos:end]."""
+    pos = LEADING_WS_RE.match(raw, pos, end).end()
+    if raw.startswith(b'<div class="container">', pos, end):
+        pos += len(b'<div class="container">')
+    pos = LEADING_WS_RE.match(raw, pos, end).end()
+    return _strip_leading_tag(raw, pos, end, b'<main')
+
+
+def extract_content_and_style(raw):
+    """Extract style dan content dari isi HTML file (bytes, UTF-8)."""
+    styles = _extract_styles(raw)
     
+    # Remove old DOCTYPE, html, head, sidebar, container structure
+    # Keep hanya content dalam main/content area
+    main_start, main_end, sidebar_end = _find_main_bounds(raw)
+    
+    # Semua pemotongan dikerjakan sebagai offset; isi hanya di-copy/decode sekali
     if main_start > 0 and main_end > main_start:
-        # Extract content antara main tags
-        content_match = html_content[main_start:main_end]
-        # Remove <main> opening tag
-        content = re.sub(r'^<main[^>]*>', '', content_match)
+        # Content antara main tags, tanpa <main> opening tag
+        start = _strip_leading_tag(raw, main_start, main_end, b'<main')
+        end = main_end
+    elif sidebar_end > 0:
+        # Fallback: skip semua sampai setelah sidebar
+        start, end = sidebar_end + 6, len(raw)
     else:
-        # Fallback: skip semua sampai menemukan content
-        sidebar_end = html_content.find('</nav>')
-        if sidebar_end > 0:
-            content = html_content[sidebar_end+6:]
-        else:
-            content = html_content
+        start, end = 0, len(raw)
     
-    # Clean up closing tags
-    content = re.sub(r'^\s*<div class="container">', '', content)
-    content = re.sub(r'^\s*<main[^>]*>', '', content)
+    start = _strip_leading_wrappers(raw, start, end)
+    content = str(memoryview(raw)[start:end], 'utf-8')
     
     return styles, content.strip()
 
 
-for filename, title in files_to_convert.items():
+def convert_one(item):
+    """Convert satu file template, return pesan log untuk dicetak."""
+    filename, (template_with_style, template_no_style) = item
     filepath = templates_dir / filename
     
-    if not filepath.exists():
-        print(f"⚠️  Skip: {filename} tidak ditemukan")
-        continue
-    
-    print(f"Processing: {filename}")
+    if filename not in existing_files:
+        return f"⚠️  Skip: {filename} tidak ditemukan"
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    # Normalisasi newline seperti mode teks (universal newlines): CRLF / CR -> LF,
+    # sehingga offset pemotongan sama dan write_text tidak menghasilkan \r\r\n di Windows
+    raw = filepath.read_bytes().replace(b'\r\n', b'\n').replace(b'\r', b'\n')
     
-    styles, content = extract_content_and_style(html_content)
+    styles, content = extract_content_and_style(raw)
     
     style_block = '\n'.join(styles) if styles else ""
     
     # Build new template
-    new_template = """{% extends "base.html" %}
-
-{% block title %}""" + title + """{% endblock %}
-
-"""
-    
-    if style_block:
-        new_template += """{% block extra_head %}
-<style>
-""" + style_block + """
-</style>
-{% endblock %}
-
-"""
-    
-    new_template += """{% block content %}
-""" + content + """
-{% endblock %}
-"""
+    template = template_with_style if style_block else template_no_style
+    new_template = template.format(style=style_block, content=content)
     
     # Write back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(new_template)
+    filepath.write_text(new_template, encoding='utf-8')
     
-    print(f"✅ Converted: {filename}")
+    return f"Processing: {filename}\n✅ Converted: {filename}"
+
+
+# Snapshot isi folder sekali (satu syscall) untuk cek keberadaan file
+try:
+    with os.scandir(templates_dir) as entries:
+        existing_files = {entry.name for entry in entries}
+except FileNotFoundError:
+    existing_files = set()
+
+# File saling independen, jadi I/O dijalankan paralel; ex.map menjaga urutan output
+with ThreadPoolExecutor(max_workers=4) as executor:
+    for message in executor.map(convert_one, specialized_templates.items()):
+        print(message)
 
 print("\n✨ Semua file berhasil dikonversi!")
@@ -0,0 +1,22 @@
+import json
+
+import orjson
+
+
+class OrjsonSerializer:
+    """
+    Serializer session berbasis orjson (pengganti django.core.signing.JSONSerializer).
+    Data upload bisa cukup besar, dan orjson jauh lebih cepat dari json stdlib.
+
+    Catatan: NaN/Infinity ditulis sebagai null oleh orjson (dibaca kembali sebagai None).
+    """
+
+    def dumps(self, obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Session lama dari JSONSerializer bisa berisi literal NaN yang ditolak orjson
+            return json.loads(data.decode('latin-1'))
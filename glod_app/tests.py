@@ -1,3 +1,478 @@
-from django.test import TestCase
+import math
+import random
 
-# Create your tests here.
+import networkx as nx
+from django.contrib.sessions.backends.cached_db import SessionStore
+from django.core.signing import JSONSerializer
+from django.test import SimpleTestCase
+
+from glod_app.session_serializers import OrjsonSerializer
+from glod_app.views.views_glod import GLODAlgorithm
+
+
+# ============================================================================
+# Referensi skalar (formula asli, satu pasangan komunitas per iterasi).
+# Jalur vektor/bitset di GLODAlgorithm harus memberi hasil yang sama.
+# ============================================================================
+
+def _reference_entropy(algo: GLODAlgorithm, comm: set, n: int) -> float:
+    w = len(comm)
+    return algo.h_binary(w, n) + algo.h_binary(n - w, n)
+
+
+def _reference_conditional_entropy(algo: GLODAlgorithm, X_comms: list, Y_comms: list, n: int) -> float:
+    total_h_x_given_y = 0.0
+    for xi in X_comms:
+        min_h_xi_yj = _reference_entropy(algo, xi, n)
+        for yj in Y_comms:
+            d = len(xi & yj)
+            c = len(xi) - d
+            b = len(yj) - d
+            a = n - (b + d + c)
+            term1 = algo.h_binary(a, a + b) if (a + b) > 0 else 0
+            term2 = algo.h_binary(c, c + d) if (c + d) > 0 else 0
+            term3 = algo.h_binary(a + c, n)
+            term4 = algo.h_binary(b + d, n)
+            h_xi_yj = term1 + term2 - term3 - term4
+            if h_xi_yj < min_h_xi_yj:
+                min_h_xi_yj = h_xi_yj
+        total_h_x_given_y += min_h_xi_yj
+    return total_h_x_given_y
+
+
+def _reference_onmi(algo: GLODAlgorithm, detected_comms: list, ground_truth_comms: list, seed_value: int = 42) -> dict:
+    num_nodes = len(algo.graph.nodes())
+    hx = sum(_reference_entropy(algo, c, num_nodes) for c in detected_comms)
+    hy = sum(_reference_entropy(algo, c, num_nodes) for c in ground_truth_comms)
+    hx_y = _reference_conditional_entropy(algo, detected_comms, ground_truth_comms, num_nodes)
+    hy_x = _reference_conditional_entropy(algo, ground_truth_comms, detected_comms, num_nodes)
+    mutual_info = 0.5 * ((hx - hx_y) + (hy - hy_x))
+
+    if hx > 0 and hy > 0:
+        nmi_lfk = 1.0 - 0.5 * (hx_y / hx + hy_x / hy)
+    else:
+        nmi_lfk = 1.0 if hx == 0 and hy == 0 else 0.0
+
+    max_entropy = max(hx, hy)
+    if max_entropy > 0:
+        nmi_max = mutual_info / max_entropy
+    else:
+        nmi_max = 1.0 if mutual_info == 0 else 0.0
+
+    random.seed(seed_value)
+    nodes_list = sorted(list(algo.graph.nodes()))
+    random_nmis = []
+    for _ in range(10):
+        random_comms = [set(random.sample(nodes_list, min(len(gt_c), num_nodes))) for gt_c in ground_truth_comms]
+        sh_rand = sum(_reference_entropy(algo, c, num_nodes) for c in random_comms)
+        hx_rand = _reference_conditional_entropy(algo, detected_comms, random_comms, num_nodes)
+        hy_rand = _reference_conditional_entropy(algo, random_comms, detected_comms, num_nodes)
+        mi_rand = 0.5 * ((hx - hx_rand) + (sh_rand - hy_rand))
+        max_ent = max(hx, sh_rand)
+        random_nmis.append(mi_rand / max_ent if max_ent > 0 else 0.0)
+
+    rnmi = nmi_max - sum(random_nmis) / len(random_nmis)
+    return {'nmi_lfk': max(0.0, nmi_lfk), 'nmi_max': max(0.0, nmi_max), 'rnmi': rnmi}
+
+
+def _reference_omega(graph: nx.Graph, candidate, community: set) -> float:
+    neighbors_vi = set(graph.neighbors(candidate))
+    NCi = neighbors_vi.intersection(community)
+    if not NCi:
+        return 0.0
+    N2_vi = set()
+    for n in neighbors_vi:
+        N2_vi.update(graph.neighbors(n))
+    max_score = 0.0
+    for vj in NCi:
+        neighbors_vj = set(graph.neighbors(vj))
+        N2_vj = set()
+        for n in neighbors_vj:
+            N2_vj.update(graph.neighbors(n))
+        denom1 = len(neighbors_vj) + 1
+        denom2 = len(N2_vj) if N2_vj else 1
+        part1 = (len(neighbors_vi & neighbors_vj) + 1) / denom1
+        part2 = (len(N2_vi & N2_vj) + 1) / denom2
+        max_score = max(max_score, part1 + 0.1 * part2)
+    degree_vi = graph.degree(candidate)
+    if degree_vi == 0:
+        return 0.0
+    return max_score / degree_vi
+
+
+def _reference_seed_score(graph: nx.Graph, rough_seed: set) -> float:
+    degree_sum = sum(graph.degree(node) for node in rough_seed)
+    edge_count = 0
+    for node1 in rough_seed:
+        for node2 in rough_seed:
+            if node1 < node2 and graph.has_edge(node1, node2):
+                edge_count += 1
+    return degree_sum + len(rough_seed) + edge_count
+
+
+def _reference_rough_seed(graph: nx.Graph, center_node) -> set:
+    rough_seed = {center_node}
+    neighbors = set(graph.neighbors(center_node))
+    available_neighbors = neighbors - rough_seed
+    while available_neighbors:
+        nc_scores = [
+            (neighbor, len(set(graph.neighbors(center_node)) & set(graph.neighbors(neighbor))))
+            for neighbor in available_neighbors
+        ]
+        nc_scores.sort(key=lambda x: (-x[1], x[0]))
+        best_neighbor, best_nc = nc_scores[0]
+        if best_nc > 0:
+            rough_seed.add(best_neighbor)
+            available_neighbors = neighbors - rough_seed
+        else:
+            break
+    return rough_seed
+
+
+def _reference_fitness(graph: nx.Graph, community: set, alpha: float) -> float:
+    k_in = 0
+    k_out = 0
+    for node in community:
+        for neighbor in graph.neighbors(node):
+            if neighbor in community:
+                k_in += 1
+            else:
+                k_out += 1
+    if k_in == 0:
+        return 0.0
+    denominator = (k_in + k_out) ** alpha
+    if denominator == 0:
+        return 0.0
+    return k_in / denominator
+
+
+def _reference_merge(communities: list, threshold: float) -> list:
+    communities = [set(c) for c in communities]
+    merged = True
+    while merged:
+        merged = False
+        new_communities = []
+        communities_to_skip = set()
+        for i in range(len(communities)):
+            if i in communities_to_skip:
+                continue
+            communities_to_merge = [i]
+            for j in range(i + 1, len(communities)):
+                if j in communities_to_skip:
+                    continue
+                overlap = communities[i] & communities[j]
+                union_size = len(communities[i] | communities[j])
+                improved_jaccard = len(overlap) / union_size if overlap and union_size else 0.0
+                if improved_jaccard >= threshold:
+                    communities_to_merge.append(j)
+                    communities_to_skip.add(j)
+                    merged = True
+            merged_community = communities[i].copy()
+            for idx in communities_to_merge[1:]:
+                merged_community = merged_community.union(communities[idx])
+            new_communities.append(merged_community)
+            communities_to_skip.add(i)
+        communities = new_communities
+    return communities
+
+
+def _reference_membership(graph: nx.Graph, communities: list) -> dict:
+    counts = {}
+    for node in graph.nodes():
+        count = sum(1 for c in communities if node in c)
+        counts[node] = count if count > 0 else 1
+    return counts
+
+
+def _reference_shen(graph: nx.Graph, communities: list) -> float:
+    m = graph.number_of_edges()
+    if m == 0:
+        return 0.0
+    Ov = _reference_membership(graph, communities)
+    total_eq = 0.0
+    for community in communities:
+        for node_v in community:
+            for node_w in community:
+                a_vw = 1 if graph.has_edge(node_v, node_w) else 0
+                expected_edges = (graph.degree(node_v) * graph.degree(node_w)) / (2 * m)
+                total_eq += (1.0 / (Ov[node_v] * Ov[node_w])) * (a_vw - expected_edges)
+    return total_eq / (2 * m)
+
+
+def _reference_lazar(graph: nx.Graph, communities: list) -> float:
+    K = len(communities)
+    if K == 0:
+        return 0.0
+    si = _reference_membership(graph, communities)
+    total_lazar = 0.0
+    for community in communities:
+        n_cr = len(community)
+        if n_cr < 2:
+            continue
+        internal_edges = graph.subgraph(community).number_of_edges()
+        max_possible_edges = (n_cr * (n_cr - 1)) / 2
+        density = internal_edges / max_possible_edges if max_possible_edges > 0 else 0.0
+        node_contributions = 0.0
+        for i in community:
+            neighbors_i = set(graph.neighbors(i))
+            k_in = len(neighbors_i.intersection(community))
+            k_out = len(neighbors_i) - k_in
+            d_i = graph.degree(i)
+            if d_i > 0:
+                node_contributions += (k_in - k_out) / (d_i * si[i])
+        total_lazar += (node_contributions / n_cr) * density
+    return total_lazar / K
+
+
+def _reference_nicosia(graph: nx.Graph, communities: list) -> float:
+    m = graph.number_of_edges()
+    if m == 0:
+        return 0.0
+    si = _reference_membership(graph, communities)
+    q_ov = 0.0
+    for community in communities:
+        for node_i in community:
+            for node_j in community:
+                beta_ij = (1.0 / si[node_i]) * (1.0 / si[node_j])
+                aij = 1 if graph.has_edge(node_i, node_j) else 0
+                q_ov += beta_ij * (aij - (graph.degree(node_i) * graph.degree(node_j)) / (2 * m))
+    return q_ov / (2 * m)
+
+
+def _reference_psi(graph: nx.Graph, community: set) -> float:
+    if not community:
+        return 0.0
+    total_k_in_community = 0
+    psi_numerator_sum = 0.0
+    for node in community:
+        if node not in graph:
+            continue
+        k_i_in = 0
+        k_i_out = 0
+        for neighbor in graph[node]:
+            weight = graph[node][neighbor].get('weight', 1)
+            if neighbor in community:
+                k_i_in += weight
+            else:
+                k_i_out += weight
+        k_i = k_i_in + k_i_out
+        if k_i > 0:
+            psi_numerator_sum += (k_i_in * k_i_out) / k_i
+        total_k_in_community += k_i_in
+    if total_k_in_community == 0:
+        return 0.0
+    return psi_numerator_sum / total_k_in_community
+
+
+def _reference_conductance(graph: nx.Graph, community: set) -> float:
+    if not community:
+        return 0.0
+    k_in = 0
+    for node1 in community:
+        for node2 in community:
+            if node1 < node2 and graph.has_edge(node1, node2):
+                k_in += graph[node1][node2].get('weight', 1)
+    k_out = 0
+    for node in community:
+        if node in graph:
+            for neighbor in graph[node]:
+                if neighbor not in community:
+                    k_out += graph[node][neighbor].get('weight', 1)
+    if k_in + k_out == 0:
+        return 0.0
+    return k_out / (k_in + k_out)
+
+
+def _labeled_graph(graph: nx.Graph) -> nx.Graph:
+    return nx.relabel_nodes(graph, {node: f"P{node:02d}" for node in graph})
+
+
+def _test_graph() -> nx.Graph:
+    """Karate club + self-loop, node terisolasi, dan beberapa edge berbobot."""
+    graph = _labeled_graph(nx.karate_club_graph())
+    for u, v in graph.edges():
+        graph[u][v].pop('weight', None)
+    graph.add_edge('P00', 'P00')
+    graph.add_edge('P05', 'P05', weight=3)
+    graph.add_edge('P00', 'P01', weight=2.5)
+    graph.add_edge('P32', 'P33', weight=0.5)
+    graph.add_nodes_from(['ISO1', 'ISO2'])
+    graph.add_edge('LOOP', 'LOOP')
+    return graph
+
+
+class ONMIMetricsTest(SimpleTestCase):
+    """calculate_onmi_metrics / H(X|Y) versi bitset dibandingkan dengan formula skalar."""
+
+    def setUp(self):
+        self.graph = _labeled_graph(nx.karate_club_graph())
+        self.algo = GLODAlgorithm(self.graph)
+        self.nodes = sorted(self.graph.nodes())
+
+    def assertMetricsEqual(self, detected, ground_truth):
+        expected = _reference_onmi(self.algo, detected, ground_truth)
+        actual = self.algo.calculate_onmi_metrics(detected, ground_truth)
+        self.assertEqual(expected.keys(), actual.keys())
+        for key, value in expected.items():
+            self.assertIs(type(actual[key]), float, key)
+            self.assertAlmostEqual(actual[key], value, places=9, msg=key)
+
+    def test_identical_partitions(self):
+        comms = [set(self.nodes[:12]), set(self.nodes[10:25]), set(self.nodes[25:])]
+        self.assertMetricsEqual(comms, [set(c) for c in comms])
+
+    def test_overlapping_partitions(self):
+        detected = [set(self.nodes[:15]), set(self.nodes[12:30])]
+        ground_truth = [set(self.nodes[:10]), set(self.nodes[8:20]), set(self.nodes[18:])]
+        self.assertMetricsEqual(detected, ground_truth)
+
+    def test_ground_truth_with_nodes_outside_graph(self):
+        # Ground truth dari user boleh memuat protein yang tidak ada di graph (a + b bisa <= 0)
+        detected = [set(self.nodes[:10]), set(self.nodes[5:30])]
+        ground_truth = [
+            set(self.nodes) | {f"EXT{i}" for i in range(30)},
+            set(self.nodes[:8]) | {f"EXT{i}" for i in range(50)},
+            set(self.nodes[20:26]) | {"EXT_A", "EXT_B"},
+        ]
+        self.assertMetricsEqual(detected, ground_truth)
+        actual = self.algo.calculate_onmi_metrics(detected, ground_truth)
+        self.assertTrue(all(abs(value) != float('inf') for value in actual.values()))
+
+    def test_conditional_entropy_random_cases(self):
+        rng = random.Random(7)
+        n = len(self.nodes)
+        for _ in range(50):
+            X = [set(rng.sample(self.nodes, rng.randint(1, 30))) for _ in range(rng.randint(1, 5))]
+            Y = [set(rng.sample(self.nodes, rng.randint(1, 30))) | {f"EXT{rng.randint(0, 60)}" for _ in range(rng.choice([0, 3, 40]))}
+                 for _ in range(rng.randint(1, 5))]
+            self.assertAlmostEqual(
+                self.algo.get_conditional_entropy_optimized(X, Y, n),
+                _reference_conditional_entropy(self.algo, X, Y, n),
+                places=9,
+            )
+            self.assertAlmostEqual(
+                self.algo.get_conditional_entropy_optimized(Y, X, n),
+                _reference_conditional_entropy(self.algo, Y, X, n),
+                places=9,
+            )
+
+
+class GLODFormulaTest(SimpleTestCase):
+    """Jalur CSR / bitset / inkremental GLODAlgorithm dibandingkan dengan formula skalar."""
+
+    def setUp(self):
+        self.graph = _test_graph()
+        self.algo = GLODAlgorithm(self.graph)
+        self.nodes = sorted(self.graph.nodes())
+        rng = random.Random(3)
+        self.communities = [set(rng.sample(self.nodes, rng.randint(1, 15))) for _ in range(25)]
+        self.communities += [{'P00', 'P01', 'P02', 'P03'}, {'P05', 'P06', 'ISO1'}, {'LOOP'}, {'ISO2'}]
+
+    def test_seed_score_and_rough_seed(self):
+        for community in self.communities:
+            self.assertEqual(self.algo.calculate_seed_score(community), _reference_seed_score(self.graph, community))
+        for node in self.nodes:
+            self.assertEqual(self.algo.create_rough_seed(node), _reference_rough_seed(self.graph, node))
+
+    def test_fitness_and_incremental_degrees(self):
+        for community in self.communities:
+            expected = _reference_fitness(self.graph, community, self.algo.alpha)
+            self.assertAlmostEqual(self.algo.fitness_function(community), expected, places=12)
+            # k_in/k_out inkremental (dipakai saat ekspansi) = hitung ulang komunitas + kandidat
+            k_in, k_out = self.algo.community_degrees(community)
+            for candidate in ('P00', 'P05', 'P33', 'ISO1', 'LOOP'):
+                if candidate in community:
+                    continue
+                degrees = self.algo.degrees_after_adding(candidate, community, k_in, k_out)
+                self.assertAlmostEqual(
+                    self.algo.fitness_from_degrees(*degrees),
+                    _reference_fitness(self.graph, community | {candidate}, self.algo.alpha),
+                    places=12,
+                )
+
+    def test_omega(self):
+        for community in self.communities:
+            for candidate in self.nodes:
+                if candidate in community:
+                    continue
+                self.assertAlmostEqual(
+                    self.algo.omega(candidate, community),
+                    _reference_omega(self.graph, candidate, community),
+                    places=12,
+                )
+
+    def test_merge_communities(self):
+        for threshold in (0.0, 0.2, 1 / 3, 0.5):
+            algo = GLODAlgorithm(self.graph, jaccard_threshold=threshold)
+            algo.communities = [set(c) for c in self.communities]
+            algo.merge_communities()
+            self.assertEqual(algo.communities, _reference_merge(self.communities, threshold))
+
+    def test_modularity(self):
+        for communities in (self.communities, self.communities[:5], [{'ISO1'}], []):
+            self.algo.communities = [set(c) for c in communities]
+            self.algo._communities_version += 1
+            self.assertAlmostEqual(self.algo.calculate_shen_modularity(), _reference_shen(self.graph, communities), places=12)
+            self.assertAlmostEqual(self.algo.calculate_lazar_modularity(), _reference_lazar(self.graph, communities), places=12)
+            self.assertAlmostEqual(self.algo.calculate_nicosia_modularity(), _reference_nicosia(self.graph, communities), places=12)
+
+    def test_psi_and_conductance(self):
+        # Komunitas boleh memuat node di luar graph (mis. dari ground truth)
+        for community in self.communities + [{'P00', 'P01', 'GHOST'}, {'GHOST'}, set()]:
+            self.assertAlmostEqual(
+                self.algo.calculate_psi_normalized_node_cut(community), _reference_psi(self.graph, community), places=12
+            )
+            self.assertAlmostEqual(
+                self.algo.calculate_conductance(community), _reference_conductance(self.graph, community), places=12
+            )
+
+    def test_entropy(self):
+        n = len(self.nodes)
+        for community in self.communities + [set(self.nodes), set()]:
+            self.assertAlmostEqual(
+                self.algo.get_entropy_single(community, n), _reference_entropy(self.algo, community, n), places=12
+            )
+
+
+class OrjsonSerializerTest(SimpleTestCase):
+    """Serializer session: round-trip orjson dan kompatibilitas dengan payload JSONSerializer lama."""
+
+    def setUp(self):
+        self.serializer = OrjsonSerializer()
+
+    def test_round_trip_non_str_keys_and_nan(self):
+        session = {
+            'uniprot_keyword': 'kinase',
+            'network_genes': ['TP53', 'EGFR'],
+            'counts': {1: 'a', 2.5: 'b'},
+            'score': float('nan'),
+            'nested': {'inf': float('inf'), 'ok': 1.5},
+        }
+        loaded = self.serializer.loads(self.serializer.dumps(session))
+        # Key non-str menjadi string (seperti JSON biasa); NaN/Infinity menjadi null
+        self.assertEqual(loaded, {
+            'uniprot_keyword': 'kinase',
+            'network_genes': ['TP53', 'EGFR'],
+            'counts': {'1': 'a', '2.5': 'b'},
+            'score': None,
+            'nested': {'inf': None, 'ok': 1.5},
+        })
+
+    def test_loads_legacy_json_serializer_payload(self):
+        legacy = {'preprocessing_genes': ['BRCA1', 'ÄKT1'], 'count': 3}
+        self.assertEqual(self.serializer.loads(JSONSerializer().dumps(legacy)), legacy)
+
+    def test_loads_legacy_payload_with_nan(self):
+        # json stdlib menulis literal NaN yang ditolak orjson: harus jatuh ke fallback json.loads
+        loaded = self.serializer.loads(JSONSerializer().dumps({'score': float('nan'), 'name': 'TP53'}))
+        self.assertEqual(loaded['name'], 'TP53')
+        self.assertTrue(math.isnan(loaded['score']))
+
+    def test_session_store_decodes_legacy_session(self):
+        # Data session yang ditandatangani dengan JSONSerializer tetap terbaca setelah serializer diganti
+        legacy_store = SessionStore()
+        legacy_store.serializer = JSONSerializer
+        encoded = legacy_store.encode({'uniprot_results_key': 'abc', 'score': float('nan')})
+        decoded = SessionStore().decode(encoded)
+        self.assertEqual(decoded['uniprot_results_key'], 'abc')
+        self.assertTrue(math.isnan(decoded['score']))
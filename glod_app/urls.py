@@ -1,4 +1,6 @@
-from django.urls import path
+from functools import cache
+
+from django.urls import include, path
 
 # Import semua views dari views submodule (yang sudah include GLOD functions)
 from .views import (
@@ -25,31 +27,44 @@ from .views import (
     download_community_data,
 )
 
-urlpatterns = [
-    # Dashboard - Root path
-    path('', dashboard_index, name='dashboard_home'),
+
+@cache
+def _build_patterns():
+    """Bangun URL patterns sekali; hasil tuple dipakai bersama (juga antar worker fork)."""
+    return (
+        # Dashboard - Root path
+        path('', dashboard_index, name='dashboard_home'),
     
-    # UniProt App routes
-    path('uniprot/', index, name='uniprot_home'),
-    path('uniprot/search/', uniprot_search, name='uniprot_search'),
-    path('uniprot/download/', uniprot_download, name='uniprot_download'),
-    path('uniprot/input/', uniprot_input_data_gen, name='uniprot_input_data_gen'),
-    path('uniprot/upload/', uniprot_upload, name='uniprot_upload'),
+        # UniProt App routes
+        path('uniprot/', include([
+            path('', index, name='uniprot_home'),
+            path('search/', uniprot_search, name='uniprot_search'),
+            path('download/', uniprot_download, name='uniprot_download'),
+            path('input/', uniprot_input_data_gen, name='uniprot_input_data_gen'),
+            path('upload/', uniprot_upload, name='uniprot_upload'),
+        ])),
     
-    # Preprocessing App routes
-    path('preprocessing/', preprocessing_index, name='preprocessing_index'),
-    path('preprocessing/use-data/', preprocessing_use_data, name='preprocessing_use_data'),
-    path('preprocessing/remove-duplicates/', preprocessing_remove_duplicates, name='preprocessing_remove_duplicates'),
-    path('preprocessing/reset-data/', preprocessing_reset_data, name='preprocessing_reset_data'),
+        # Preprocessing App routes
+        path('preprocessing/', include([
+            path('', preprocessing_index, name='preprocessing_index'),
+            path('use-data/', preprocessing_use_data, name='preprocessing_use_data'),
+            path('remove-duplicates/', preprocessing_remove_duplicates, name='preprocessing_remove_duplicates'),
+            path('reset-data/', preprocessing_reset_data, name='preprocessing_reset_data'),
+        ])),
     
-    # String App routes
-    path('string/', string_network_input, name='string_network_input'),
+        # String App routes
+        path('string/', string_network_input, name='string_network_input'),
     
-    # Results App routes
-    path('results/', results_index, name='results_home'),
+        # Results App routes
+        path('results/', results_index, name='results_home'),
     
-    # GLOD App routes
-    path('glod/process/', glod_process, name='glod_process'),
-    path('glod/result/', glod_result, name='glod_result'),
-    path('glod/download/', download_community_data, name='download_community_data'),
-]
+        # GLOD App routes
+        path('glod/', include([
+            path('process/', glod_process, name='glod_process'),
+            path('result/', glod_result, name='glod_result'),
+            path('download/', download_community_data, name='download_community_data'),
+        ])),
+    )
+
+
+urlpatterns = _build_patterns()
@@ -26,24 +26,12 @@ from .views_results import (
     results_index,
 )
 
-# Import GLOD views dari parent glod_app/views.py module
-# We need to import directly from the original views.py file
-import os
-import importlib.util
-
-# Get path to original views.py file
-_views_file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'views.py')
-
-# Load the original views module
-_spec = importlib.util.spec_from_file_location("_glod_original_views", _views_file_path)
-_glod_original = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_glod_original)
-
-# Re-export GLOD functions
-glod_process = _glod_original.glod_process
-glod_result = _glod_original.glod_result
-download_community_data = _glod_original.download_community_data
-GLODAlgorithm = _glod_original.GLODAlgorithm
+from .views_glod import (
+    glod_process,
+    glod_result,
+    download_community_data,
+    GLODAlgorithm,
+)
 
 __all__ = [
     # Uniprot
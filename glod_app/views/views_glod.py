@@ -1,16 +1,32 @@
 import json
+import logging
 import networkx as nx
+import orjson
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
 from typing import List, Set, Dict, Tuple
 from django.shortcuts import render
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+import heapq
 import math
 import csv
+import os
+import tempfile
+import numpy as np
 from datetime import datetime
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 
+logger = logging.getLogger(__name__)
+
+# Jumlah bit 1 untuk setiap nilai byte, dipakai untuk popcount bitset komunitas
+_POPCOUNT_LUT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+# Batas memori sementara per blok baris saat menghitung irisan bitset pada ONMI (byte)
+_ONMI_BLOCK_BYTES = 4 * 1024 * 1024
+# Jumlah thread maksimum untuk evaluasi partisi acak rNMI dalam satu request
+_ONMI_MAX_WORKERS = 4
 
 class GLODAlgorithm:
     """
@@ -23,6 +39,45 @@ class GLODAlgorithm:
         self.alpha = alpha
         self.jaccard_threshold = jaccard_threshold
         self.communities: List[Set] = []
+        self._communities_version = 0  # Dinaikkan setiap self.communities berubah
+        self._membership_cache = None
+        self._bitset_cache = None
+        self._overlap_sum_cache = None
+        self._h_table_cache: Dict = {}  # n -> tabel h_binary(w, n) untuk w = 0..n, lihat h_table()
+        
+        # Cache adjacency & degree sekali per graph (graph tidak berubah selama run)
+        # sehingga method lain tidak membangun set(self.graph.neighbors(x)) berulang kali
+        self.adj: Dict = {node: frozenset(nbrs) for node, nbrs in graph.adj.items()}
+        self.deg: Dict = dict(graph.degree())
+        self._n2_cache: Dict = {}  # Memo 2-hop neighborhood, lihat _n2()
+        self._pair_score_cache: Dict = {}  # Memo skor pasangan omega, lihat _pair_score()
+        
+        # Representasi CSR (indptr/indices int32) untuk operasi vektor NumPy:
+        # neighbor dari node ke-i adalah indices[indptr[i]:indptr[i+1]], bobot edge-nya
+        # di weights pada posisi yang sama (default 1 jika edge tanpa atribut 'weight')
+        self.nodes_list = list(graph.nodes())
+        self.node_idx: Dict = {node: i for i, node in enumerate(self.nodes_list)}
+        degrees = np.fromiter((len(self.adj[node]) for node in self.nodes_list), dtype=np.int64, count=len(self.nodes_list))
+        self.indptr = np.zeros(len(self.nodes_list) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=self.indptr[1:])
+        self.indices = np.fromiter(
+            (self.node_idx[nbr] for node in self.nodes_list for nbr in graph._adj[node]),
+            dtype=np.int32, count=int(self.indptr[-1])
+        )
+        self.weights = np.fromiter(
+            (attrs.get('weight', 1) for node in self.nodes_list for attrs in graph._adj[node].values()),
+            dtype=np.float64, count=int(self.indptr[-1])
+        )
+        self.self_loop_weight_arr = np.fromiter(
+            (graph._adj[node][node].get('weight', 1) if node in graph._adj[node] else 0 for node in self.nodes_list),
+            dtype=np.float64, count=len(self.nodes_list)
+        )
+        self.deg_arr = np.fromiter((self.deg[node] for node in self.nodes_list), dtype=np.int64, count=len(self.nodes_list))
+        # Strength (jumlah bobot edge) per node, self-loop dihitung sekali seperti di weights
+        self.strength_arr = np.bincount(
+            np.repeat(np.arange(len(self.nodes_list)), degrees), weights=self.weights, minlength=len(self.nodes_list)
+        )
+        self.self_loop_arr = np.fromiter((node in self.adj[node] for node in self.nodes_list), dtype=np.bool_, count=len(self.nodes_list))
 
     def omega(self, candidate: str, community: Set) -> float:
         """
@@ -41,72 +96,99 @@ class GLODAlgorithm:
         Normalisasi 1.1 hanya untuk menggabungkan bobot orde 1 dan 2,
         tetapi divisor luar kurung adalah derajat node vi.
         """
-        neighbors_vi = set(self.graph.neighbors(candidate))
+        neighbors_vi = self.adj[candidate]
         NCi = neighbors_vi.intersection(community)
         if not NCi:
             return 0.0
 
-        # 2-hop neighbors of vi
-        N2_vi = set()
-        for n in neighbors_vi:
-            N2_vi.update(self.graph.neighbors(n))
-
         max_score = 0.0
 
         # Iterasi melalui semua node di NCi dan hitung similarity
+        pair_cache = self._pair_score_cache
         for vj in NCi:
-            neighbors_vj = set(self.graph.neighbors(vj))
-
-            # 2-hop neighbors of vj
-            N2_vj = set()
-            for n in neighbors_vj:
-                N2_vj.update(self.graph.neighbors(n))
-
-            # Penyebut orde 1: |N(vj)| + 1 sesuai Equation 4
-            denom1 = len(neighbors_vj) + 1
-            # Penyebut orde 2: |N2(vj)| (tanpa +1)
-            denom2 = len(N2_vj) if N2_vj else 1
-
-            # Orde 1 similarity: (|N(vi)∩N(vj)|+1) / (|N(vj)|+1)
-            part1 = (len(neighbors_vi & neighbors_vj) + 1) / denom1
-            # Orde 2 similarity dengan bobot 0.1: (|N2(vi)∩N2(vj)|+1) / |N2(vj)|
-            part2 = (len(N2_vi & N2_vj) + 1) / denom2
-
-            # Score menurut paper equation 4
-            score = part1 + 0.1 * part2
+            score = pair_cache.get((candidate, vj))
+            if score is None:
+                score = self._pair_score(candidate, vj)
+                pair_cache[(candidate, vj)] = score
             max_score = max(max_score, score)
 
         # PERBAIKAN: Pembagi harusnya D(vi) = derajat dari candidate node, bukan 1.1
         # Normalisasi 1.1 adalah untuk inner bracket, outer bracket dibagi D(vi)
-        degree_vi = self.graph.degree(candidate)
+        degree_vi = self.deg[candidate]
         if degree_vi == 0:
             return 0.0
         
         return max_score / degree_vi
-            
+    
+    def omega_upper_bound(self, candidate) -> float:
+        """
+        Batas atas ω(vi) tanpa menghitung 2-hop: part1 <= 1 dan part2 <= 2 (Equation 4),
+        jadi skor pasangan <= 1.2 dan ω(vi) <= 1.2 / D(vi). Diberi margin untuk pembulatan float.
+        """
+        degree_vi = self.deg[candidate]
+        if degree_vi == 0:
+            return 0.0
+        return 1.25 / degree_vi
+    
+    def _pair_score(self, vi, vj) -> float:
+        """
+        Skor dalam kurung Equation 4 untuk pasangan (vi, vj).
+        
+        Hanya bergantung pada graph (bukan komunitas), sehingga omega() me-memo hasilnya
+        di _pair_score_cache: kandidat yang sama dievaluasi ulang di setiap iterasi ekspansi.
+        """
+        neighbors_vi = self.adj[vi]
+        neighbors_vj = self.adj[vj]
+
+        # 2-hop neighbors of vi dan vj
+        N2_vi = self._n2(vi)
+        N2_vj = self._n2(vj)
+
+        # Penyebut orde 1: |N(vj)| + 1 sesuai Equation 4
+        denom1 = len(neighbors_vj) + 1
+        # Penyebut orde 2: |N2(vj)| (tanpa +1)
+        denom2 = len(N2_vj) if N2_vj else 1
+
+        # Orde 1 similarity: (|N(vi)∩N(vj)|+1) / (|N(vj)|+1)
+        part1 = (len(neighbors_vi & neighbors_vj) + 1) / denom1
+        # Orde 2 similarity dengan bobot 0.1: (|N2(vi)∩N2(vj)|+1) / |N2(vj)|
+        part2 = (len(N2_vi & N2_vj) + 1) / denom2
+
+        # Score menurut paper equation 4
+        return part1 + 0.1 * part2
+    
+    def _n2(self, node) -> frozenset:
+        """2-hop neighbors N2(v) = ∪ N(u) untuk u ∈ N(v), di-memo per node."""
+        n2 = self._n2_cache.get(node)
+        if n2 is None:
+            n2 = frozenset().union(*(self.adj[n] for n in self.adj[node]))
+            self._n2_cache[node] = n2
+        return n2
+    
     def common_neighbor_similarity(self, node1, node2) -> int:
         """Hitung Common Neighbor Similarity (NC)"""
-        neighbors1 = set(self.graph.neighbors(node1))
-        neighbors2 = set(self.graph.neighbors(node2))
-        return len(neighbors1.intersection(neighbors2))
+        return len(self.adj[node1] & self.adj[node2])
     
     def calculate_seed_score(self, rough_seed: Set) -> float:
         """
         Hitung score untuk rough seed:
         Score = Sum(degree) + Count(Nodes) + Count(Internal Edges)
         """
+        if not rough_seed:
+            return 0
+        idx, mask = self.community_mask(rough_seed)
+        
         # Sum of degrees
-        degree_sum = sum(self.graph.degree(node) for node in rough_seed)
+        degree_sum = int(self.deg_arr[idx].sum())
         
         # Count nodes
-        node_count = len(rough_seed)
+        node_count = len(idx)
         
-        # Count internal edges
-        edge_count = 0
-        for node1 in rough_seed:
-            for node2 in rough_seed:
-                if node1 < node2 and self.graph.has_edge(node1, node2):
-                    edge_count += 1
+        # Count internal edges: neighbor di dalam seed menghitung tiap edge dua kali
+        # (self-loop tidak dihitung, sama seperti syarat node1 < node2)
+        incidences = int(np.count_nonzero(mask[self.csr_neighbors(idx)]))
+        self_loops = int(np.count_nonzero(self.self_loop_arr[idx]))
+        edge_count = (incidences - self_loops) // 2
         
         return degree_sum + node_count + edge_count
     
@@ -127,46 +209,83 @@ class GLODAlgorithm:
         Ekspansi dilakukan di tahap EXPANSION PHASE (Algorithm 2)
         """
         rough_seed = {center_node}
-        neighbors = set(self.graph.neighbors(center_node))
+        neighbors = self.adj[center_node]
         available_neighbors = neighbors - rough_seed
         
         # Fase konstruksi rough seed: tambahkan tetangga dengan NC tertinggi secara iteratif
         # Sesuai Algorithm 1, Line 8: Vi ← ({vi} ∪ N(vi))
-        # Iterasi sampai tidak ada neighbor dengan NC > 0
-        while available_neighbors:
-            nc_scores = [
-                (neighbor, self.common_neighbor_similarity(center_node, neighbor)) 
-                for neighbor in available_neighbors
-            ]
-            # Sort by NC (descending), then by node ID (ascending) untuk tie-breaking konsisten
-            nc_scores.sort(key=lambda x: (-x[1], x[0]))
-            
-            best_neighbor, best_nc = nc_scores[0]
-            
+        # NC hanya bergantung pada center_node dan graph (tetap), jadi cukup dihitung dan
+        # di-sort sekali; urutan penambahan sama dengan memilih NC tertinggi tiap iterasi
+        nc_scores = [
+            (neighbor, self.common_neighbor_similarity(center_node, neighbor)) 
+            for neighbor in available_neighbors
+        ]
+        # Sort by NC (descending), then by node ID (ascending) untuk tie-breaking konsisten
+        nc_scores.sort(key=lambda x: (-x[1], x[0]))
+        
+        for neighbor, nc in nc_scores:
             # Add neighbor jika NC > 0 (ada common neighbors)
-            if best_nc > 0:
-                rough_seed.add(best_neighbor)
-                available_neighbors = neighbors - rough_seed
-            else:
+            if nc <= 0:
                 # Tidak ada neighbor lagi dengan NC > 0, stop constructing rough seed
                 break
+            rough_seed.add(neighbor)
         
         return rough_seed
     
+    def community_mask(self, community: Set) -> Tuple[np.ndarray, np.ndarray]:
+        """Index CSR node komunitas dan bitmap keanggotaannya (panjang N)."""
+        idx = np.fromiter((self.node_idx[node] for node in community), dtype=np.int64, count=len(community))
+        mask = np.zeros(len(self.nodes_list), dtype=np.bool_)
+        mask[idx] = True
+        return idx, mask
+    
+    def csr_positions(self, idx: np.ndarray) -> np.ndarray:
+        """Posisi CSR (ke indices/weights) semua neighbor dari node-node idx, tanpa loop Python."""
+        starts = self.indptr[idx]
+        lengths = self.indptr[idx + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+        # Posisi CSR tiap neighbor: start node-nya + offset di dalam segmennya
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return offsets + np.arange(total)
+    
+    def csr_neighbors(self, idx: np.ndarray) -> np.ndarray:
+        """Gabungan (dengan duplikat) index neighbor dari node-node idx, tanpa loop Python."""
+        return self.indices[self.csr_positions(idx)]
+    
+    def community_degrees(self, community: Set) -> Tuple[int, int]:
+        """Hitung (k_in, k_out) komunitas: jumlah ujung edge internal dan eksternal."""
+        if not community:
+            return 0, 0
+        idx, mask = self.community_mask(community)
+        neighbors = self.csr_neighbors(idx)
+        k_in = int(np.count_nonzero(mask[neighbors]))  # Internal degree
+        k_out = len(neighbors) - k_in  # External degree
+        return k_in, k_out
+    
+    def degrees_after_adding(self, candidate, community: Set, k_in: int, k_out: int) -> Tuple[int, int]:
+        """
+        (k_in, k_out) dari community ∪ {candidate} secara inkremental, tanpa rescan komunitas.
+        
+        Edge candidate→C pindah dari k_out ke k_in (dihitung dari kedua ujung),
+        self-loop menambah k_in, sisa neighbor candidate menambah k_out.
+        """
+        neighbors = self.adj[candidate]
+        inter = len(neighbors & community)
+        loop = 1 if candidate in neighbors else 0
+        new_k_in = k_in + 2 * inter + loop
+        new_k_out = k_out - inter + (len(neighbors) - inter - loop)
+        return new_k_in, new_k_out
+    
     def fitness_function(self, community: Set) -> float:
         """
         Fitness function: f(C) = k_in / (k_in + k_out)^alpha
         """
-        k_in = 0  # Internal degree
-        k_out = 0  # External degree
-        
-        for node in community:
-            for neighbor in self.graph.neighbors(node):
-                if neighbor in community:
-                    k_in += 1
-                else:
-                    k_out += 1
-        
+        return self.fitness_from_degrees(*self.community_degrees(community))
+    
+    def fitness_from_degrees(self, k_in: int, k_out: int) -> float:
+        """Fitness f(C) dari (k_in, k_out) yang sudah dihitung."""
         if k_in == 0:
             return 0.0
         
@@ -183,11 +302,38 @@ class GLODAlgorithm:
         if len(seed) == 0:
             return 0.0
         
-        candidate_neighbors = set(self.graph.neighbors(candidate))
+        candidate_neighbors = self.adj[candidate]
         intersection = candidate_neighbors.intersection(seed)
         
         return len(intersection) / len(seed)
     
+    def _score_candidate(self, candidate, community: Set, k_in: int, k_out: int, current_fitness: float,
+                         best_omega: float = float('-inf')) -> Dict:
+        """
+        Skor satu kandidat shell untuk Algorithm 2: fitness gain, ω(vi), dan F(v,s).
+        
+        Tidak mengubah community; antar kandidat saling independen.
+        Jika batas atas ω(vi) < best_omega, omega tidak dihitung dan bernilai None.
+        """
+        # Hitung fitness gain dari f(C ∪ {candidate})
+        new_k_in, new_k_out = self.degrees_after_adding(candidate, community, k_in, k_out)
+        fitness_gain = self.fitness_from_degrees(new_k_in, new_k_out) - current_fitness
+        
+        # Hitung omega (dilewati jika tidak mungkin mengalahkan best_omega)
+        if self.omega_upper_bound(candidate) < best_omega:
+            omega_val = None
+        else:
+            omega_val = self.omega(candidate, community)
+        
+        # Hitung influence F(v,s)
+        influence = self.influence_function(candidate, community)
+        
+        return {
+            'fitness': fitness_gain,
+            'omega': omega_val,
+            'influence': influence
+        }
+    
     def expand_seed(self, seed: Set) -> Set:
         """
         Expansion phase menggunakan OR logic (Algorithm 2 dari paper).
@@ -214,61 +360,51 @@ class GLODAlgorithm:
         """
         community = seed.copy()
         improved = True
-        initial_fitness = self.fitness_function(community)
+        # k_in/k_out dipelihara inkremental, tidak perlu rescan komunitas per kandidat
+        k_in, k_out = self.community_degrees(community)
+        initial_fitness = self.fitness_from_degrees(k_in, k_out)
+        # Shell nodes (neighbors dari community yang belum di community), juga dipelihara inkremental
+        shell_nodes = set().union(*(self.adj[node] for node in community)) - community
         iterations = 0
         min_fitness_gain_threshold = 0.0001  # Stopping condition yang ketat
         max_community_size_ratio = 0.5  # Jangan biarkan komunitas > 50% dari graph
         max_community_size = max(3, int(self.graph.number_of_nodes() * max_community_size_ratio))
         
-        print(f"  Expanding seed (size: {len(seed)}, initial fitness: {initial_fitness:.4f})")
-        print(f"  Max community size allowed: {max_community_size} nodes")
+        logger.debug("  Expanding seed (size: %d, initial fitness: %.4f)", len(seed), initial_fitness)
+        logger.debug("  Max community size allowed: %d nodes", max_community_size)
         
         while improved:
             improved = False
-            current_fitness = self.fitness_function(community)
-            
-            # Dapatkan shell nodes (neighbors dari community yang belum di community)
-            shell_nodes = set()
-            for node in community:
-                for neighbor in self.graph.neighbors(node):
-                    if neighbor not in community:
-                        shell_nodes.add(neighbor)
+            current_fitness = self.fitness_from_degrees(k_in, k_out)
             
             if not shell_nodes:
-                print(f"    Stopping: No shell nodes found")
+                logger.debug("    Stopping: No shell nodes found")
                 break
             
             # SAFEGUARD: Jika community sudah terlalu besar, stop
             if len(community) >= max_community_size:
-                print(f"    Stopping: Community size ({len(community)}) reached max limit ({max_community_size})")
+                logger.debug("    Stopping: Community size (%d) reached max limit (%d)", len(community), max_community_size)
                 break
             
             # Hitung semua nilai untuk semua candidates (Algorithm 2)
             # Sort shell_nodes untuk konsistensi iterasi
+            # omega kandidat yang batas atasnya < omega terbaik sejauh ini tidak dihitung (None):
+            # kandidat itu tidak mungkin menjadi argmax omega
             candidate_scores = {}
+            best_omega = float('-inf')
             for candidate in sorted(shell_nodes):
-                test_community = community.copy()
-                test_community.add(candidate)
-                
-                # Hitung fitness gain
-                fitness_gain = self.fitness_function(test_community) - current_fitness
-                
-                # Hitung omega
-                omega_val = self.omega(candidate, community)
-                
-                # Hitung influence F(v,s)
-                influence = self.influence_function(candidate, community)
-                
-                candidate_scores[candidate] = {
-                    'fitness': fitness_gain,
-                    'omega': omega_val,
-                    'influence': influence
-                }
+                scores = self._score_candidate(candidate, community, k_in, k_out, current_fitness, best_omega)
+                candidate_scores[candidate] = scores
+                if scores['omega'] is not None and scores['omega'] > best_omega:
+                    best_omega = scores['omega']
             
             # Implementasi OR logic: cari node yang merupakan argmax dari salah satu fungsi
             # Langkah 1: Hitung argmax untuk setiap fungsi
             best_by_fitness = max(candidate_scores.items(), key=lambda x: x[1]['fitness'])
-            best_by_omega = max(candidate_scores.items(), key=lambda x: x[1]['omega'])
+            best_by_omega = max(
+                (item for item in candidate_scores.items() if item[1]['omega'] is not None),
+                key=lambda x: x[1]['omega']
+            )
             best_by_influence = max(candidate_scores.items(), key=lambda x: x[1]['influence'])
             
             # Langkah 2: Kumpulkan semua node yang merupakan argmax dari setidaknya satu fungsi
@@ -279,6 +415,9 @@ class GLODAlgorithm:
                 best_by_influence[0]
             }
             argmax_nodes = sorted(argmax_nodes_set)  # Sort untuk konsistensi iterasi
+            for candidate in argmax_nodes:
+                if candidate_scores[candidate]['omega'] is None:
+                    candidate_scores[candidate]['omega'] = self.omega(candidate, community)
             
             # Langkah 3: Pilih node terbaik di antara argmax nodes dengan kriteria ketat
             best_candidate = None
@@ -334,29 +473,35 @@ class GLODAlgorithm:
                 
                 # TERTIARY CRITERION: jika tidak memenuhi di atas, stop
                 if not add_node and best_fitness_gain < min_fitness_gain_threshold:
-                    print(f"    Stopping expansion: No candidate meets criteria")
-                    print(f"      Best: {best_candidate} by {best_criterion}")
-                    print(f"      fitness_gain: {best_fitness_gain:.6f} (threshold: {min_fitness_gain_threshold})")
-                    print(f"      omega: {candidate_scores[best_candidate]['omega']:.4f}")
-                    print(f"      influence: {candidate_scores[best_candidate]['influence']:.4f}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("    Stopping expansion: No candidate meets criteria")
+                        logger.debug("      Best: %s by %s", best_candidate, best_criterion)
+                        logger.debug("      fitness_gain: %.6f (threshold: %s)", best_fitness_gain, min_fitness_gain_threshold)
+                        logger.debug("      omega: %.4f", candidate_scores[best_candidate]['omega'])
+                        logger.debug("      influence: %.4f", candidate_scores[best_candidate]['influence'])
                     break
             
             if add_node and best_candidate is not None:
+                k_in, k_out = self.degrees_after_adding(best_candidate, community, k_in, k_out)
                 community.add(best_candidate)
+                shell_nodes.discard(best_candidate)
+                shell_nodes |= self.adj[best_candidate] - community
                 improved = True
                 iterations += 1
-                print(f"    Added node {best_candidate} {reason} (community size: {len(community)})")
+                logger.debug("    Added node %s %s (community size: %d)", best_candidate, reason, len(community))
             else:
                 break
         
-        final_fitness = self.fitness_function(community)
-        print(f"    Expansion complete: {len(seed)} → {len(community)} nodes, fitness: {initial_fitness:.4f} → {final_fitness:.4f} ({iterations} iterations)")
+        final_fitness = self.fitness_from_degrees(k_in, k_out)
+        logger.debug("    Expansion complete: %d → %d nodes, fitness: %.4f → %.4f (%d iterations)",
+                     len(seed), len(community), initial_fitness, final_fitness, iterations)
         return community
     
     def jaccard_coefficient(self, comm1: Set, comm2: Set) -> float:
         """Hitung Jaccard Coefficient standar untuk dua komunitas"""
-        intersection = len(comm1.intersection(comm2))
-        union = len(comm1.union(comm2))
+        # |A ∪ B| = |A| + |B| - |A ∩ B|, tanpa membangun set union
+        intersection = len(comm1 & comm2)
+        union = len(comm1) + len(comm2) - intersection
         
         if union == 0:
             return 0.0
@@ -381,14 +526,15 @@ class GLODAlgorithm:
         comm1 = self.communities[comm_idx1]
         comm2 = self.communities[comm_idx2]
         
-        # Temukan overlapping nodes (node yang ada di KEDUA komunitas)
-        overlapping_nodes = comm1.intersection(comm2)
+        # Temukan overlapping nodes (node yang ada di KEDUA komunitas): popcount(Ci AND Cj)
+        bitsets = self._community_bitsets()
+        overlap_count = int(_POPCOUNT_LUT[bitsets[comm_idx1] & bitsets[comm_idx2]].sum(dtype=np.int64))
         
-        if not overlapping_nodes:
+        if not overlap_count:
             return 0.0
         
-        # Hitung union dari kedua komunitas
-        union_size = len(comm1.union(comm2))
+        # Hitung ukuran union dari kedua komunitas: |Ci| + |Cj| - |Ci ∩ Cj|
+        union_size = len(comm1) + len(comm2) - overlap_count
         if union_size == 0:
             return 0.0
         
@@ -396,10 +542,41 @@ class GLODAlgorithm:
         # Karena semua overlapping node memiliki kontribusi yang sama (1/union_size),
         # maka total = |overlapping_nodes| * (1/union_size)
         # = |overlapping_nodes| / union_size
-        improved_jaccard = len(overlapping_nodes) / union_size
+        improved_jaccard = overlap_count / union_size
         
         return improved_jaccard
     
+    def _overlapping_partners(self, dirty: Set = None) -> List[List[int]]:
+        """
+        Untuk setiap komunitas i, daftar index j > i (urut naik) yang perlu dicek saat merge.
+        
+        Pasangan tanpa node bersama punya improved Jaccard 0, jadi hanya pasangan yang
+        muncul bersama di inverted index node -> komunitas yang dicek. Jika threshold <= 0,
+        J = 0 pun memenuhi syarat sehingga semua pasangan tetap dicek.
+        
+        Jika dirty diberikan, hanya pasangan yang melibatkan minimal satu komunitas di dirty
+        yang dikembalikan (pasangan lain sudah dicek di pass sebelumnya dan tidak berubah).
+        """
+        num_comms = len(self.communities)
+        if self.jaccard_threshold <= 0:
+            return [
+                [j for j in range(i + 1, num_comms) if dirty is None or i in dirty or j in dirty]
+                for i in range(num_comms)
+            ]
+        
+        node_to_comms = defaultdict(list)
+        for idx, comm in enumerate(self.communities):
+            for node in comm:
+                node_to_comms[node].append(idx)
+        
+        partner_sets = [set() for _ in range(num_comms)]
+        for comm_indices in node_to_comms.values():
+            for a, b in combinations(comm_indices, 2):
+                if dirty is None or a in dirty or b in dirty:
+                    partner_sets[a].add(b)
+        
+        return [sorted(partner_set) for partner_set in partner_sets]
+    
     def merge_communities(self):
         """
         Merge phase (Algorithm 3 dari paper).
@@ -411,16 +588,22 @@ class GLODAlgorithm:
         PENTING: Paper menggunakan 1/3 sebagai default, tapi kami memungkinkan user 
         untuk mengatur threshold ini secara dinamis untuk eksperimentasi.
         """
-        print(f"\nStarting merge phase with improved Jaccard coefficient (threshold: {self.jaccard_threshold:.4f})")
-        print(f"Communities before merging: {len(self.communities)}")
+        logger.info("Starting merge phase with improved Jaccard coefficient (threshold: %.4f)", self.jaccard_threshold)
+        logger.info("Communities before merging: %d", len(self.communities))
         
         merge_count = 0
         merged = True
+        # Komunitas hasil merge pada pass sebelumnya (None = pass pertama, cek semua).
+        # Pasangan dua komunitas yang tidak berubah sudah terbukti J < threshold, jadi
+        # pass berikutnya cukup mengecek pasangan yang melibatkan komunitas baru.
+        dirty = None
         
         while merged:
             merged = False
             new_communities = []
+            new_dirty = set()
             communities_to_skip = set()
+            partners = self._overlapping_partners(dirty)
             
             for i in range(len(self.communities)):
                 if i in communities_to_skip:
@@ -430,7 +613,7 @@ class GLODAlgorithm:
                 communities_to_merge = [i]  # Mulai dengan komunitas saat ini
                 
                 # Cari semua overlapping dengan komunitas lain
-                for j in range(i + 1, len(self.communities)):
+                for j in partners[i]:
                     if j in communities_to_skip:
                         continue
                     
@@ -441,8 +624,8 @@ class GLODAlgorithm:
                     
                     # Jika J >= threshold, mark untuk merge
                     if improved_jaccard >= self.jaccard_threshold:
-                        print(f"  Merging C{i} (size={len(current_comm)}) and C{j} (size={len(other_comm)}) " +
-                              f"(Improved Jaccard: {improved_jaccard:.4f} >= {self.jaccard_threshold:.4f})")
+                        logger.debug("  Merging C%d (size=%d) and C%d (size=%d) (Improved Jaccard: %.4f >= %.4f)",
+                                     i, len(current_comm), j, len(other_comm), improved_jaccard, self.jaccard_threshold)
                         communities_to_merge.append(j)
                         communities_to_skip.add(j)
                         merged = True
@@ -450,9 +633,11 @@ class GLODAlgorithm:
                 
                 # Merge semua komunitas yang dipilih
                 if len(communities_to_merge) > 1:
-                    merged_community = current_comm.copy()
-                    for idx in communities_to_merge[1:]:
-                        merged_community = merged_community.union(self.communities[idx])
+                    # Satu union multi-argumen: tanpa copy awal dan set sementara per komunitas
+                    merged_community = current_comm.union(
+                        *(self.communities[idx] for idx in communities_to_merge[1:])
+                    )
+                    new_dirty.add(len(new_communities))
                     new_communities.append(merged_community)
                 else:
                     new_communities.append(current_comm)
@@ -460,9 +645,46 @@ class GLODAlgorithm:
                 communities_to_skip.add(i)
             
             self.communities = new_communities
+            self._communities_version += 1
+            dirty = new_dirty
+        
+        logger.info("Merging complete: %d merges performed", merge_count)
+        logger.info("Communities after merging: %d", len(self.communities))
+    
+    def _community_bitsets(self) -> np.ndarray:
+        """
+        Bitset (packbits, 8 node per byte) tiap komunitas: baris ke-i untuk self.communities[i].
         
-        print(f"Merging complete: {merge_count} merges performed")
-        print(f"Communities after merging: {len(self.communities)}\n")
+        Di-cache dengan kunci yang sama seperti _membership_counts().
+        """
+        key = (self._communities_version, id(self.communities), len(self.communities))
+        if self._bitset_cache is None or self._bitset_cache[0] != key:
+            self._bitset_cache = (key, self.pack_bitsets(self.communities, self.node_idx))
+        return self._bitset_cache[1]
+    
+    @staticmethod
+    def pack_bitsets(comms: List[Set], node_index: Dict) -> np.ndarray:
+        """Matriks bitset (packbits) |comms| x ceil(|node_index|/8) untuk index node yang diberikan."""
+        masks = np.zeros((len(comms), len(node_index)), dtype=np.bool_)
+        for row, comm in enumerate(comms):
+            if comm:
+                masks[row, np.fromiter((node_index[node] for node in comm), dtype=np.int64, count=len(comm))] = True
+        return np.packbits(masks, axis=1)
+    
+    def _membership_counts(self) -> Counter:
+        """
+        Jumlah komunitas yang mengandung setiap node (O_v / s_i), satu pass atas Σ|C|.
+        
+        Di-cache sampai self.communities berubah (versi dinaikkan di run/merge_communities,
+        list baru yang di-assign langsung juga terdeteksi lewat id/len).
+        """
+        key = (self._communities_version, id(self.communities), len(self.communities))
+        if self._membership_cache is None or self._membership_cache[0] != key:
+            counts = Counter()
+            for comm in self.communities:
+                counts.update(comm)
+            self._membership_cache = (key, counts)
+        return self._membership_cache[1]
     
     def calculate_shen_modularity(self) -> float:
         """
@@ -482,39 +704,46 @@ class GLODAlgorithm:
         if m == 0:
             return 0.0
         
+        # O_v = 1/α_v: Persamaan (2) Shen et al. identik dengan bentuk belonging factor
+        # Nicosia (non-fuzzy), jadi keduanya memakai jumlah yang sama
+        total_eq = self._weighted_overlap_sum()
+        
+        # Normalisasi akhir dengan 1/(2m)
+        return total_eq / (2 * m)
+    
+    def _weighted_overlap_sum(self) -> float:
+        """
+        Σ_c [ Σ_{v,w∈c} A_vw/(O_v*O_w) - (Σ_{v∈c} k_v/O_v)² / 2m ] (belum dibagi 2m).
+        
+        Dipakai bersama oleh Shen EQ dan Nicosia Q_ov, di-cache sampai self.communities berubah.
+        """
+        key = (self._communities_version, id(self.communities), len(self.communities))
+        if self._overlap_sum_cache is not None and self._overlap_sum_cache[0] == key:
+            return self._overlap_sum_cache[1]
+        
+        m = self.graph.number_of_edges()
         # Persiapan variabel: O_v adalah jumlah komunitas yang diikuti oleh vertex v
-        Ov = {}
-        for node in self.graph.nodes():
-            count = sum(1 for comm in self.communities if node in comm)
-            Ov[node] = count if count > 0 else 1  # Hindari pembagian dengan nol
+        # (setiap node di dalam komunitas punya O_v >= 1, jadi tidak ada pembagian dengan nol)
+        Ov = self._membership_counts()
         
-        total_eq = 0.0
+        total = 0.0
         
-        # Implementasi Persamaan (2) Shen et al.
+        # Tanpa loop pasangan O(|C|²):
+        # - suku A_vw hanya bernilai 1 untuk pasangan yang bertetangga, cukup telusuri edge internal
+        # - suku null model terfaktorisasi: Σ_v Σ_w k_v*k_w/(O_v*O_w*2m) = (Σ_v k_v/O_v)² / 2m
         for community in self.communities:
-            nodes_in_comm = list(community)
-            for i in range(len(nodes_in_comm)):
-                node_v = nodes_in_comm[i]
-                k_v = self.graph.degree(node_v)
-                o_v = Ov[node_v]
-                
-                for j in range(len(nodes_in_comm)):
-                    node_w = nodes_in_comm[j]
-                    k_w = self.graph.degree(node_w)
-                    o_w = Ov[node_w]
-                    
-                    # A_vw: 1 jika bertetangga, 0 jika tidak
-                    a_vw = 1 if self.graph.has_edge(node_v, node_w) else 0
-                    
-                    # Suku dalam kurung: [A_vw - (k_v * k_w / 2m)]
-                    expected_edges = (k_v * k_w) / (2 * m)
-                    actual_minus_expected = a_vw - expected_edges
-                    
-                    # Tambahkan kontribusi ke EQ dengan bobot 1/(O_v * O_w)
-                    total_eq += (1.0 / (o_v * o_w)) * actual_minus_expected
+            inv_o = {node: 1.0 / Ov[node] for node in community}
+            
+            edge_term = 0.0
+            for node_v, inv_v in inv_o.items():
+                for node_w in self.adj[node_v] & community:
+                    edge_term += inv_v * inv_o[node_w]
+            
+            degree_term = sum(self.deg[node] * inv for node, inv in inv_o.items())
+            total += edge_term - (degree_term * degree_term) / (2 * m)
         
-        # Normalisasi akhir dengan 1/(2m)
-        return total_eq / (2 * m)
+        self._overlap_sum_cache = (key, total)
+        return total
     
     def calculate_lazar_modularity(self) -> float:
         """
@@ -541,10 +770,7 @@ class GLODAlgorithm:
             return 0.0
         
         # Hitung s_i: jumlah komunitas yang mengandung setiap node
-        si = {}
-        for node in self.graph.nodes():
-            count = sum(1 for c in self.communities if node in c)
-            si[node] = count if count > 0 else 1
+        si = self._membership_counts()
         
         total_lazar = 0.0
         
@@ -555,29 +781,35 @@ class GLODAlgorithm:
             if n_cr < 2:
                 continue
             
-            # Hitung densitas internal: edge internal / max possible edges
-            internal_edges = self.graph.subgraph(community).number_of_edges()
-            max_possible_edges = (n_cr * (n_cr - 1)) / 2
-            density = internal_edges / max_possible_edges if max_possible_edges > 0 else 0.0
-            
             # Hitung kontribusi node dalam komunitas
             node_contributions = 0.0
+            internal_incidences = 0  # Σ k_in: tiap edge internal terhitung dua kali, self-loop sekali
+            self_loops = 0
             for i in community:
-                neighbors_i = set(self.graph.neighbors(i))
+                neighbors_i = self.adj[i]
                 
                 # k_in: neighbors yang ada di komunitas
-                k_in = len(neighbors_i.intersection(community))
+                k_in = len(neighbors_i & community)
+                internal_incidences += k_in
+                if i in neighbors_i:
+                    self_loops += 1
                 
                 # k_out: neighbors yang di luar komunitas
                 k_out = len(neighbors_i) - k_in
                 
                 # d_i: total degree
-                d_i = self.graph.degree(i)
+                d_i = self.deg[i]
                 
                 # Sesuai Persamaan 2 Lázár: (k_in - k_out) / (d_i * s_i)
                 if d_i > 0:
                     node_contributions += (k_in - k_out) / (d_i * si[i])
             
+            # Hitung densitas internal: edge internal / max possible edges
+            # (edge internal = edge subgraph komunitas, self-loop dihitung sekali)
+            internal_edges = (internal_incidences + self_loops) // 2
+            max_possible_edges = (n_cr * (n_cr - 1)) / 2
+            density = internal_edges / max_possible_edges if max_possible_edges > 0 else 0.0
+            
             # M^ov_cr = (average contribution per node) * density
             m_cr = (node_contributions / n_cr) * density
             total_lazar += m_cr
@@ -609,39 +841,12 @@ class GLODAlgorithm:
         if m == 0:
             return 0.0
         
-        # Hitung s_i: jumlah komunitas yang mengandung setiap node
-        si = {}
-        for node in self.graph.nodes():
-            count = sum(1 for c in self.communities if node in c)
-            si[node] = count if count > 0 else 1
-        
-        q_ov = 0.0
-        
-        # Iterasi per komunitas
-        for community in self.communities:
-            nodes_in_comm = list(community)
-            
-            # Iterasi semua pair node dalam komunitas
-            for idx_i in range(len(nodes_in_comm)):
-                node_i = nodes_in_comm[idx_i]
-                k_i = self.graph.degree(node_i)
-                
-                for idx_j in range(len(nodes_in_comm)):
-                    node_j = nodes_in_comm[idx_j]
-                    k_j = self.graph.degree(node_j)
-                    
-                    # Belonging factor: β_ij,c = α_i,c * α_j,c
-                    # Dimana α_i,c = 1/s_i untuk non-fuzzy case
-                    beta_ij = (1.0 / si[node_i]) * (1.0 / si[node_j])
-                    
-                    # Adjacency matrix: 1 jika edge ada, 0 jika tidak
-                    aij = 1 if self.graph.has_edge(node_i, node_j) else 0
-                    
-                    # Null model Newman (undirected): k_i * k_j / 2m
-                    null_model = (k_i * k_j) / (2 * m)
-                    
-                    # Kontribusi modularity: β * (A - null_model)
-                    q_ov += beta_ij * (aij - null_model)
+        # Belonging factor α_i,c = 1/s_i (non-fuzzy), β_ij,c = α_i,c * α_j,c, dengan
+        # s_i = jumlah komunitas yang mengandung node i. Per komunitas:
+        # - Σ_{i,j} α_i α_j A_ij hanya tidak nol untuk pasangan bertetangga (telusuri edge internal)
+        # - Σ_{i,j} α_i α_j k_i k_j / 2m = (Σ_i α_i k_i)² / 2m (null model Newman, undirected)
+        # Jumlah ini sama persis dengan Shen EQ sehingga dihitung sekali di _weighted_overlap_sum()
+        q_ov = self._weighted_overlap_sum()
         
         # Normalisasi dengan 2m
         return q_ov / (2 * m)
@@ -665,29 +870,28 @@ class GLODAlgorithm:
         # 2. Iterasi setiap node untuk menghitung sigma
         psi_numerator_sum = 0.0
         
-        for node in community:
-            if node not in self.graph:
-                continue
-                
-            k_i_in = 0   # internal degree node i
-            k_i_out = 0  # external degree node i
+        # Node yang tidak ada di graph diabaikan
+        members = [node for node in community if node in self.node_idx]
+        if members:
+            idx, mask = self.community_mask(members)
+            positions = self.csr_positions(idx)
+            weights = self.weights[positions]
+            internal = mask[self.indices[positions]]
+            # owner[k] = urutan (di idx) node pemilik posisi CSR ke-k
+            owner = np.repeat(np.arange(len(idx)), self.indptr[idx + 1] - self.indptr[idx])
             
-            for neighbor in self.graph[node]:
-                weight = self.graph[node][neighbor].get('weight', 1)
-                if neighbor in community:
-                    k_i_in += weight
-                else:
-                    k_i_out += weight
+            k_i_in = np.bincount(owner, weights=np.where(internal, weights, 0.0), minlength=len(idx))   # internal degree node i
+            k_i_out = np.bincount(owner, weights=np.where(internal, 0.0, weights), minlength=len(idx))  # external degree node i
             
             # k_i adalah total degree node tersebut [cite: 4098]
             k_i = k_i_in + k_i_out
             
-            if k_i > 0:
-                # Formula inti: (k_in_i * k_out_i) / k_i 
-                psi_numerator_sum += (k_i_in * k_i_out) / k_i
-                
+            # Formula inti: (k_in_i * k_out_i) / k_i, hanya untuk node dengan k_i > 0
+            has_degree = k_i > 0
+            psi_numerator_sum = float(((k_i_in * k_i_out)[has_degree] / k_i[has_degree]).sum())
+            
             # Tambahkan ke total k_in komunitas
-            total_k_in_community += k_i_in
+            total_k_in_community = float(k_i_in.sum())
 
         if total_k_in_community == 0:
             return 0.0
@@ -718,27 +922,28 @@ class GLODAlgorithm:
         if not community:
             return 0.0
         
-        # Hitung jumlah edge internal (k_in)
-        k_in = 0
-        for node1 in community:
-            for node2 in community:
-                if node1 < node2:
-                    if self.graph.has_edge(node1, node2):
-                        k_in += self.graph[node1][node2].get('weight', 1)
-        
-        # Hitung jumlah edge eksternal (cut edges) (k_out)
-        k_out = 0
-        for node in community:
-            if node in self.graph:
-                for neighbor in self.graph[node]:
-                    if neighbor not in community:
-                        k_out += self.graph[node][neighbor].get('weight', 1)
+        # Node yang tidak ada di graph diabaikan
+        members = [node for node in community if node in self.node_idx]
+        if not members:
+            return 0.0
+        idx, mask = self.community_mask(members)
+        positions = self.csr_positions(idx)
+        internal_positions = positions[mask[self.indices[positions]]]
+        
+        # Bobot neighbor di dalam komunitas menghitung tiap edge internal dua kali dan self-loop sekali
+        internal_weight = self.weights[internal_positions].sum()
+        
+        # Hitung jumlah edge internal (k_in); self-loop tidak termasuk k_in
+        k_in = (internal_weight - self.self_loop_weight_arr[idx].sum()) / 2
+        
+        # Hitung jumlah edge eksternal (cut edges) (k_out): total strength dikurangi bagian internal
+        k_out = self.strength_arr[idx].sum() - internal_weight
         
         # Jika tidak ada edge sama sekali, return 0
         if k_in + k_out == 0:
             return 0.0
         
-        return k_out / (k_in + k_out)
+        return float(k_out / (k_in + k_out))
     
     def h_binary(self, w: int, n: int) -> float:
         """
@@ -759,6 +964,31 @@ class GLODAlgorithm:
         
         return -(term1 + term2)
     
+    def h_binary_vec(self, w: np.ndarray, n) -> np.ndarray:
+        """
+        Versi vektor dari h_binary: h(w, n) per elemen, 0 jika w = 0 atau w = n.
+        
+        n boleh skalar atau array sepanjang w.
+        """
+        w = np.asarray(w, dtype=np.float64)
+        n = np.broadcast_to(np.asarray(n, dtype=np.float64), w.shape)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p = w / n
+            q = (n - w) / n
+            # Hindari log(0), sama seperti h_binary
+            term1 = np.where(p > 0, p * np.log2(p), 0.0)
+            term2 = np.where(q > 0, q * np.log2(q), 0.0)
+        # w = 0 atau w = n (termasuk n = 0) entropinya 0
+        return np.where((w == 0) | (w == n), 0.0, -(term1 + term2))
+    
+    def h_table(self, n: int) -> np.ndarray:
+        """Tabel h_binary(w, n) untuk w = 0..n (index = w), dihitung sekali per n."""
+        table = self._h_table_cache.get(n)
+        if table is None:
+            table = self.h_binary_vec(np.arange(n + 1), n)
+            self._h_table_cache[n] = table
+        return table
+    
     def get_entropy_single(self, comm: Set, n: int) -> float:
         """
         Menghitung entropi dari satu komunitas.
@@ -767,9 +997,20 @@ class GLODAlgorithm:
         Dimana h adalah fungsi entropi biner.
         """
         w = len(comm)
-        return self.h_binary(w, n) + self.h_binary(n - w, n)
+        if w > n:
+            return self.h_binary(w, n) + self.h_binary(n - w, n)
+        table = self.h_table(n)
+        return float(table[w] + table[n - w])
     
-    def get_conditional_entropy_optimized(self, X_comms: List[Set], Y_comms: List[Set], n: int) -> float:
+    def get_entropy_vector(self, sizes: np.ndarray, n: int) -> np.ndarray:
+        """H(C_i) untuk banyak komunitas sekaligus dari array ukurannya (lihat get_entropy_single)."""
+        if not len(sizes) or int(sizes.max()) <= n:
+            table = self.h_table(n)
+            return table[sizes] + table[n - sizes]
+        return self.h_binary_vec(sizes, n) + self.h_binary_vec(n - sizes, n)
+    
+    def get_conditional_entropy_optimized(self, X_comms: List[Set], Y_comms: List[Set], n: int,
+                                          x_entropies: np.ndarray = None) -> float:
         """
         Menghitung H(X|Y) = Σ_i min_j H*(X_i|Y_j)
         
@@ -777,41 +1018,81 @@ class GLODAlgorithm:
         
         Untuk setiap partisi X_i dalam X, cari partisi Y_j dalam Y yang memiliki 
         conditional entropy minimum, dengan constraint matching.
+        
+        x_entropies: H(X_i) yang sudah dihitung (urutan sama dengan X_comms), opsional.
         """
+        # Bitset keanggotaan: |xi ∩ yj| = popcount(xi AND yj) untuk semua yj sekaligus.
+        node_index = self._membership_index(X_comms, Y_comms)
+        x_sizes = np.fromiter((len(xi) for xi in X_comms), dtype=np.int64, count=len(X_comms))
+        if x_entropies is None:
+            x_entropies = self.get_entropy_vector(x_sizes, n)
+        y_sizes = np.fromiter((len(yj) for yj in Y_comms), dtype=np.int64, count=len(Y_comms))
+        return self._conditional_entropy_bits(
+            self.pack_bitsets(X_comms, node_index), x_sizes, x_entropies,
+            self.pack_bitsets(Y_comms, node_index), y_sizes, n
+        )
+    
+    def _membership_index(self, *comm_lists: List[Set]) -> Dict:
+        """Index node untuk bitset: self.node_idx, ditambah index baru untuk node di luar graph (mis. dari ground truth)."""
+        extra_nodes = set().union(*(comm for comms in comm_lists for comm in comms)).difference(self.node_idx)
+        if not extra_nodes:
+            return self.node_idx
+        node_index = dict(self.node_idx)
+        node_index.update((node, len(self.node_idx) + k) for k, node in enumerate(extra_nodes))
+        return node_index
+    
+    def _conditional_entropy_bits(self, x_bits: np.ndarray, x_sizes: np.ndarray, x_entropies: List[float],
+                                  y_bits: np.ndarray, y_sizes: np.ndarray, n: int) -> float:
+        """H(X|Y) dari bitset keanggotaan (lihat get_conditional_entropy_optimized)."""
         total_h_x_given_y = 0.0
-        
-        for xi in X_comms:
-            h_xi = self.get_entropy_single(xi, n)
-            min_h_xi_yj = h_xi  # Default: jika tidak ada matching yang lebih baik
+        if not len(y_sizes):
+            # Tidak ada Y_j: H*(X_i|Y) = H(X_i)
+            for h_xi in x_entropies:
+                total_h_x_given_y += float(h_xi)
+            return total_h_x_given_y
+        
+        # Hitung H* sesuai Equation 2 McDaid: 
+        # H*(X_i|Y_j) = H(a,b) + H(c,d) - H(a+c) - H(b+d)
+        # dimana H(x,y) = h_binary(x, x+y), 0 jika x+y = 0
+        # term3/term4 hanya bergantung pada j (a+c = n-|yj|, b+d = |yj|), jadi dihitung sekali
+        # per Y_j lalu di-broadcast ke semua X_i; nilainya diambil dari tabel h_binary(·, n)
+        # (selalu di [0, n] kecuali yj memuat node di luar graph)
+        use_table = int(y_sizes.max()) <= n
+        h_n = self.h_table(n)
+        term3 = h_n[n - y_sizes] if use_table else self.h_binary_vec(n - y_sizes, n)
+        term4 = h_n[y_sizes] if use_table else self.h_binary_vec(y_sizes, n)
+        
+        # Irisan dihitung per blok baris: hanya blok X_i dan blok Y_j yang di-unpack ke matriks
+        # keanggotaan biner, sehingga array sementara (blok x N untuk unpack, blok x |Y| untuk
+        # tabel kontingensi) tetap di sekitar _ONMI_BLOCK_BYTES
+        n_bits = x_bits.shape[1] * 8
+        block_rows = max(1, min(_ONMI_BLOCK_BYTES // (n_bits * 4), _ONMI_BLOCK_BYTES // (len(y_bits) * 8)))
+        y_block_rows = max(1, _ONMI_BLOCK_BYTES // (n_bits * 4))
+        
+        for start in range(0, len(x_bits), block_rows):
+            x_members = np.unpackbits(x_bits[start:start + block_rows], axis=1).astype(np.float32)
+            # Tabel kontingensi 2x2 untuk semua pasangan (i, j) dalam blok (matriks blok x |Y|):
+            # a = not in xi, not in yj
+            # b = not in xi, in yj
+            # c = in xi, not in yj
+            # d = in xi, in yj
+            # d = MX @ MY^T; jumlah 0/1 di float32 eksak selama N < 2^24
+            d = np.empty((len(x_members), len(y_bits)), dtype=np.int64)  # Intersection
+            for y_start in range(0, len(y_bits), y_block_rows):
+                y_members = np.unpackbits(y_bits[y_start:y_start + y_block_rows], axis=1).astype(np.float32)
+                d[:, y_start:y_start + y_block_rows] = np.rint(x_members @ y_members.T)
+            c = x_sizes[start:start + block_rows, None] - d   # In xi but not yj
+            b = y_sizes[None, :] - d   # In yj but not xi
+            a = n - (b + d + c)  # Not in either
             
-            for yj in Y_comms:
-                # Buat tabel kontingensi 2x2:
-                # a = not in xi, not in yj
-                # b = not in xi, in yj
-                # c = in xi, not in yj
-                # d = in xi, in yj
-                
-                d = len(xi & yj)  # Intersection
-                c = len(xi) - d   # In xi but not yj
-                b = len(yj) - d   # In yj but not xi
-                a = n - (b + d + c)  # Not in either
-                
-                # Hitung H* sesuai Equation 2 McDaid: 
-                # H*(X_i|Y_j) = H(a,b) + H(c,d) - H(a+c) - H(b+d)
-                # dimana H(x,y) = h_binary(x, x+y)
-                
-                term1 = self.h_binary(a, a + b) if (a + b) > 0 else 0
-                term2 = self.h_binary(c, c + d) if (c + d) > 0 else 0
-                term3 = self.h_binary(a + c, n)
-                term4 = self.h_binary(b + d, n)
-                
-                h_xi_yj = term1 + term2 - term3 - term4
-                
-                # Cari minimum
-                if h_xi_yj < min_h_xi_yj:
-                    min_h_xi_yj = h_xi_yj
+            # H(a,b) / H(c,d) = 0 jika a+b <= 0 / c+d <= 0 (a bisa negatif bila Y_j memuat node di luar graph)
+            term1 = np.where(a + b > 0, self.h_binary_vec(a, a + b), 0.0)
+            term2 = np.where(c + d > 0, self.h_binary_vec(c, c + d), 0.0)
+            row_min = (term1 + term2 - term3[None, :] - term4[None, :]).min(axis=1)
             
-            total_h_x_given_y += min_h_xi_yj
+            for i, h_min in enumerate(row_min, start):
+                # Cari minimum; default H(X_i) jika tidak ada matching yang lebih baik
+                total_h_x_given_y += min(float(x_entropies[i]), float(h_min))
         
         return total_h_x_given_y
     
@@ -856,12 +1137,17 @@ class GLODAlgorithm:
             }
         
         # 1. Hitung Entropi Total H(X) dan H(Y)
-        hx = sum(self.get_entropy_single(c, num_nodes) for c in detected_comms)
-        hy = sum(self.get_entropy_single(c, num_nodes) for c in ground_truth_comms)
+        # Entropi per komunitas disimpan untuk dipakai ulang di H(X|Y), H(Y|X), dan loop rNMI
+        detected_sizes = np.fromiter((len(c) for c in detected_comms), dtype=np.int64, count=len(detected_comms))
+        truth_sizes = np.fromiter((len(c) for c in ground_truth_comms), dtype=np.int64, count=len(ground_truth_comms))
+        x_entropies = self.get_entropy_vector(detected_sizes, num_nodes)
+        y_entropies = self.get_entropy_vector(truth_sizes, num_nodes)
+        hx = float(x_entropies.sum())
+        hy = float(y_entropies.sum())
         
         # 2. Hitung Conditional Entropy H(X|Y) dan H(Y|X)
-        hx_y = self.get_conditional_entropy_optimized(detected_comms, ground_truth_comms, num_nodes)
-        hy_x = self.get_conditional_entropy_optimized(ground_truth_comms, detected_comms, num_nodes)
+        hx_y = self.get_conditional_entropy_optimized(detected_comms, ground_truth_comms, num_nodes, x_entropies)
+        hy_x = self.get_conditional_entropy_optimized(ground_truth_comms, detected_comms, num_nodes, y_entropies)
         
         # 3. Hitung Mutual Information I(X:Y) sesuai McDaid Equation 5:
         # I(X:Y) = 0.5 * [(H(X) - H(X|Y)) + (H(Y) - H(Y|X))]
@@ -890,50 +1176,58 @@ class GLODAlgorithm:
         
         import random
         random.seed(seed_value)  # Set seed untuk konsistensi hasil
-        random_nmis = []
         nodes_list = sorted(list(self.graph.nodes()))  # Sort untuk konsistensi
         
-        # Generate 10 partisi acak dengan distribusi ukuran yang sama
+        # Partisi acak langsung dibangun sebagai bitset (tanpa set Python per komunitas).
+        # random.sample hanya bergantung pada panjang populasi, jadi sampling posisi di
+        # nodes_list menghasilkan pilihan yang sama dengan random.sample(nodes_list, ...)
+        node_index = self._membership_index(detected_comms)
+        sorted_to_index = np.fromiter((node_index[node] for node in nodes_list), dtype=np.int64, count=num_nodes)
+        detected_bits = self.pack_bitsets(detected_comms, node_index)
+        rand_sizes = np.minimum(truth_sizes, num_nodes)
+        # H(Y_j) hanya bergantung pada ukuran, sama untuk semua partisi acak
+        rand_entropies = self.get_entropy_vector(rand_sizes, num_nodes)
+        sh_rand = float(rand_entropies.sum())
+        
+        # Generate 10 partisi acak dengan distribusi ukuran yang sama.
+        # Sampling tetap berurutan (satu stream random ber-seed), evaluasinya paralel
+        random_partitions = []
         for _ in range(10):
-            random_comms = []
-            for gt_c in ground_truth_comms:
+            rand_masks = np.zeros((len(ground_truth_comms), len(node_index)), dtype=np.bool_)
+            for row, size in enumerate(rand_sizes):
                 # Buat partisi acak dengan ukuran yang sama dengan komunitas ground truth
-                size = len(gt_c)
-                random_comm = set(random.sample(nodes_list, min(size, num_nodes)))
-                random_comms.append(random_comm)
-            
+                positions = random.sample(range(num_nodes), int(size))
+                rand_masks[row, sorted_to_index[positions]] = True
+            random_partitions.append(np.packbits(rand_masks, axis=1))
+        
+        def random_nmi(rand_bits: np.ndarray) -> float:
             # Hitung NMI_max untuk pasangan (detected_comms, random_comms)
-            sh_rand = sum(self.get_entropy_single(c, num_nodes) for c in random_comms)
-            hx_rand = self.get_conditional_entropy_optimized(detected_comms, random_comms, num_nodes)
-            hy_rand = self.get_conditional_entropy_optimized(random_comms, detected_comms, num_nodes)
+            hx_rand = self._conditional_entropy_bits(detected_bits, detected_sizes, x_entropies,
+                                                     rand_bits, rand_sizes, num_nodes)
+            hy_rand = self._conditional_entropy_bits(rand_bits, rand_sizes, rand_entropies,
+                                                     detected_bits, detected_sizes, num_nodes)
             mi_rand = 0.5 * ((hx - hx_rand) + (sh_rand - hy_rand))
             
             max_ent = max(hx, sh_rand)
             if max_ent > 0:
-                nmi_rand = mi_rand / max_ent
-            else:
-                nmi_rand = 0.0
-            
-            random_nmis.append(nmi_rand)
+                return mi_rand / max_ent
+            return 0.0
+        
+        # Operasi NumPy (matmul, log2) melepas GIL, jadi thread cukup; urutan hasil tetap.
+        # Jumlah thread dibatasi karena tiap thread memegang blok array sementaranya sendiri
+        max_workers = min(len(random_partitions), os.cpu_count() or 1, _ONMI_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            random_nmis = list(executor.map(random_nmi, random_partitions))
         
         # rNMI = NMI_max - E[NMI_random]
         avg_random_nmi = sum(random_nmis) / len(random_nmis) if random_nmis else 0.0
         rnmi = nmi_max - avg_random_nmi
         
-        print(f"\n{'='*60}")
-        print(f"ONMI Metrics Calculation:")
-        print(f"  H(X) [detected]:     {hx:.4f}")
-        print(f"  H(Y) [ground_truth]: {hy:.4f}")
-        print(f"  H(X|Y):              {hx_y:.4f}")
-        print(f"  H(Y|X):              {hy_x:.4f}")
-        print(f"  I(X:Y):              {mutual_info:.4f}")
-        print(f"  Avg Random NMI:      {avg_random_nmi:.4f}")
-        print(f"{'='*60}")
-        print(f"NMI Results:")
-        print(f"  NMI_LFK (Lancichinetti):  {max(0, nmi_lfk):.4f}")
-        print(f"  NMI_max (McDaid):         {max(0, nmi_max):.4f}")
-        print(f"  rNMI (Relative):          {rnmi:.4f}")
-        print(f"{'='*60}\n")
+        logger.info(
+            "ONMI Metrics Calculation: H(X)=%.4f H(Y)=%.4f H(X|Y)=%.4f H(Y|X)=%.4f I(X:Y)=%.4f Avg Random NMI=%.4f",
+            hx, hy, hx_y, hy_x, mutual_info, avg_random_nmi
+        )
+        logger.info("NMI Results: NMI_LFK=%.4f NMI_max=%.4f rNMI=%.4f", max(0, nmi_lfk), max(0, nmi_max), rnmi)
         
         return {
             'nmi_lfk': max(0.0, nmi_lfk),      # Clamp ke [0, 1]
@@ -966,8 +1260,8 @@ class GLODAlgorithm:
         import random
         random.seed(seed_value)
         
-        print(f"Starting GLOD with {self.graph.number_of_nodes()} nodes and {self.graph.number_of_edges()} edges")
-        print(f"Random seed set to {seed_value} for reproducible results")
+        logger.info("Starting GLOD with %d nodes and %d edges", self.graph.number_of_nodes(), self.graph.number_of_edges())
+        logger.info("Random seed set to %s for reproducible results", seed_value)
         
         # Phase 1: Seeding (Algorithm 1)
         # NL = koleksi node yang belum memiliki label komunitas (dapat diproses sebagai seed)
@@ -976,11 +1270,16 @@ class GLODAlgorithm:
         all_nodes = set(self.graph.nodes())
         candidate_seeds = []
         
-        print(f"Seeding phase: Starting with {len(NL)} unlabeled nodes")
+        logger.info("Seeding phase: Starting with %d unlabeled nodes", len(NL))
         
         iteration = 0
         max_iterations = 1000  # Safety limit
         
+        # Heap (-degree, node) dibangun sekali: pop memberi node derajat tertinggi di NL
+        # tanpa scan ulang NL tiap iterasi; entry yang sudah tidak ada di NL dilewati
+        center_heap = [(-self.deg[node], node) for node in NL]
+        heapq.heapify(center_heap)
+        
         # Sesuai Algorithm 1: while NL != empty, process nodes
         while NL and iteration < max_iterations:
             iteration += 1
@@ -988,18 +1287,18 @@ class GLODAlgorithm:
             # Pilih node dengan derajat tertinggi dari NL sebagai center (Algorithm 1, line 3)
             # Sorting by centrality ensures good seed selection
             # PENTING: Gunakan sorting dengan tie-breaking konsisten menggunakan node ID
-            best_center = min(
-                NL, 
-                key=lambda node: (-self.graph.degree(node), node)  # Negative degree untuk max, node ID untuk tie-break
-            )
+            # (Negative degree untuk max, node ID untuk tie-break)
+            _, best_center = heapq.heappop(center_heap)
+            while best_center not in NL:
+                _, best_center = heapq.heappop(center_heap)
             
-            print(f"\nIteration {iteration}: Processing center node {best_center} (degree: {self.graph.degree(best_center)}, NL size: {len(NL)})")
+            logger.debug("Iteration %d: Processing center node %s (degree: %d, NL size: %d)", iteration, best_center, self.deg[best_center], len(NL))
             
             # Buat rough seed dari center node (Algorithm 1, line 8: Vi = {vi} ∪ N(vi))
             rough_seed = self.create_rough_seed(best_center)
             score = self.calculate_seed_score(rough_seed)
             
-            print(f"  Rough seed created: size {len(rough_seed)}, score {score:.2f}")
+            logger.debug("  Rough seed created: size %d, score %.2f", len(rough_seed), score)
             
             candidate_seeds.append((rough_seed, score, best_center))
             
@@ -1009,29 +1308,29 @@ class GLODAlgorithm:
             
             # Safety break: jika NL terlalu besar, hanya proses top candidates
             if len(candidate_seeds) >= 100:
-                print(f"  Reached 100 candidate seeds, processing them now...")
+                logger.debug("  Reached 100 candidate seeds, processing them now...")
                 break
         
         # Urutkan berdasarkan score untuk prioritas ekspansi
         candidate_seeds.sort(key=lambda x: x[1], reverse=True)
-        print(f"\nSeeding phase complete: {len(candidate_seeds)} candidate seeds found")
+        logger.info("Seeding phase complete: %d candidate seeds found", len(candidate_seeds))
         
         # Phase 2: Expansion (Algorithm 2)
         # Proses candidate seeds dan ekspansi ke komunitas
         processed_seeds = set()
         nodes_in_communities = set()  # Track which nodes have been assigned
         
-        print(f"\nExpansion phase: Processing {len(candidate_seeds)} candidate seeds")
+        logger.info("Expansion phase: Processing %d candidate seeds", len(candidate_seeds))
         
         for seed_idx, (candidate_seed, score, center_node) in enumerate(candidate_seeds, 1):
-            # Hindari seed duplicate
-            seed_tuple = tuple(sorted(candidate_seed))
-            if seed_tuple in processed_seeds:
+            # Hindari seed duplicate (frozenset: hash O(|seed|) tanpa sorting)
+            seed_key = frozenset(candidate_seed)
+            if seed_key in processed_seeds:
                 continue
             
-            processed_seeds.add(seed_tuple)
+            processed_seeds.add(seed_key)
             
-            print(f"\n  Seed {seed_idx}/{len(candidate_seeds)}: center={center_node}, seed_size={len(candidate_seed)}")
+            logger.debug("  Seed %d/%d: center=%s, seed_size=%d", seed_idx, len(candidate_seeds), center_node, len(candidate_seed))
             
             # Ekspansi seed (Algorithm 2)
             community = self.expand_seed(candidate_seed)
@@ -1039,45 +1338,41 @@ class GLODAlgorithm:
             # Simpan komunitas jika valid (minimal 3 node)
             if len(community) >= 3:
                 self.communities.append(community)
+                self._communities_version += 1
                 nodes_in_communities.update(community)
-                print(f"    Community saved: {len(community)} nodes")
+                logger.debug("    Community saved: %d nodes", len(community))
             else:
-                print(f"    Community rejected: size {len(community)} < 3")
+                logger.debug("    Community rejected: size %d < 3", len(community))
         
         # Hitung statistics
         unlabeled_nodes = all_nodes - nodes_in_communities
         
-        print(f"\n{'='*60}")
-        print(f"After expansion phase:")
-        print(f"  Total communities: {len(self.communities)}")
-        print(f"  Nodes in at least one community: {len(nodes_in_communities)}/{len(all_nodes)}")
-        print(f"  Unlabeled nodes: {len(unlabeled_nodes)}")
+        logger.info("After expansion phase:")
+        logger.info("  Total communities: %d", len(self.communities))
+        logger.info("  Nodes in at least one community: %d/%d", len(nodes_in_communities), len(all_nodes))
+        logger.info("  Unlabeled nodes: %d", len(unlabeled_nodes))
         
-        # Hitung overlapping statistics
-        node_community_count = {}
-        for node in nodes_in_communities:
-            count = sum(1 for comm in self.communities if node in comm)
-            node_community_count[node] = count
+        # Hitung overlapping statistics (satu pass atas Σ|C|, lihat _membership_counts)
+        node_community_count = self._membership_counts()
         
         overlapping_nodes = sum(1 for count in node_community_count.values() if count > 1)
-        print(f"  Overlapping nodes (in multiple communities): {overlapping_nodes}")
-        print(f"{'='*60}\n")
+        logger.info("  Overlapping nodes (in multiple communities): %d", overlapping_nodes)
         
         # Phase 3: Merging (Algorithm 3)
         self.merge_communities()
         
-        print(f"Final {len(self.communities)} communities after merging")
-        print(f"Parameters used: alpha={self.alpha}, jaccard_threshold={self.jaccard_threshold}")
+        logger.info("Final %d communities after merging", len(self.communities))
+        logger.info("Parameters used: alpha=%s, jaccard_threshold=%s", self.alpha, self.jaccard_threshold)
         
         # Hitung semua modularitas metrics
-        print(f"\nCalculating modularity metrics...")
+        logger.info("Calculating modularity metrics...")
         shen_eq = self.calculate_shen_modularity()
         lazar_mov = self.calculate_lazar_modularity()
         nicosia_qov = self.calculate_nicosia_modularity()
         
-        print(f"Calculated Shen Modularity (EQ): {shen_eq:.4f}")
-        print(f"Calculated Lázár Modularity (M^ov): {lazar_mov:.4f}")
-        print(f"Calculated Nicosia Modularity (Q_ov): {nicosia_qov:.4f}\n")
+        logger.info("Calculated Shen Modularity (EQ): %.4f", shen_eq)
+        logger.info("Calculated Lázár Modularity (M^ov): %.4f", lazar_mov)
+        logger.info("Calculated Nicosia Modularity (Q_ov): %.4f", nicosia_qov)
         
         return self.communities, shen_eq, lazar_mov, nicosia_qov
 
@@ -1086,13 +1381,13 @@ class GLODAlgorithm:
 def glod_process(request):
     """Halaman input parameter GLOD dan proses algoritma"""
     
-    print(f"glod_process called with method: {request.method}")
+    logger.debug("glod_process called with method: %s", request.method)
     
     if request.method == "POST":
         # Ambil data jaringan dari POST
         network_data_json = request.POST.get('network_data')
         
-        print(f"Received network_data_json: {network_data_json[:100] if network_data_json else 'None'}...")
+        logger.debug("Received network_data_json: %s...", network_data_json[:100] if network_data_json else 'None')
         
         if not network_data_json:
             return render(request, 'glod_app/process.html', {
@@ -1101,9 +1396,9 @@ def glod_process(request):
         
         try:
             network_data = json.loads(network_data_json)
-            print(f"Parsed network data: {len(network_data.get('nodes', []))} nodes, {len(network_data.get('edges', []))} edges")
+            logger.info("Parsed network data: %d nodes, %d edges", len(network_data.get('nodes', [])), len(network_data.get('edges', [])))
         except json.JSONDecodeError as e:
-            print(f"JSON decode error: {e}")
+            logger.warning("JSON decode error: %s", e)
             return render(request, 'glod_app/process.html', {
                 'error': f'Format data jaringan tidak valid: {str(e)}'
             })
@@ -1112,7 +1407,7 @@ def glod_process(request):
         request.session['glod_network_data'] = network_data
         request.session.save()
         
-        print("Network data saved to session")
+        logger.debug("Network data saved to session")
         
         # Tampilkan halaman input parameter
         context = {
@@ -1150,11 +1445,7 @@ def glod_result(request):
     alpha = float(request.POST.get('alpha', 0.8))
     jaccard_threshold = float(request.POST.get('jaccard_threshold', 0.33))
     
-    print(f"\n{'='*60}")
-    print(f"GLOD Algorithm Parameters:")
-    print(f"Alpha (α): {alpha}")
-    print(f"Jaccard Threshold: {jaccard_threshold}")
-    print(f"{'='*60}\n")
+    logger.info("GLOD Algorithm Parameters: alpha (α)=%s, jaccard_threshold=%s", alpha, jaccard_threshold)
     
     # Ambil data jaringan dari session
     network_data = request.session.get('glod_network_data')
@@ -1169,18 +1460,16 @@ def glod_result(request):
         G = nx.Graph()
         
         # Tambahkan nodes
-        for node in network_data['nodes']:
-            G.add_node(node['id'])
+        G.add_nodes_from(node['id'] for node in network_data['nodes'])
         
         # Tambahkan edges
-        for edge in network_data['edges']:
-            G.add_edge(edge['source'], edge['target'])
+        G.add_edges_from((edge['source'], edge['target']) for edge in network_data['edges'])
         
-        print(f"Graph created: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+        logger.info("Graph created: %d nodes, %d edges", G.number_of_nodes(), G.number_of_edges())
         
         # Jalankan algoritma GLOD
         glod = GLODAlgorithm(G, alpha=alpha, jaccard_threshold=jaccard_threshold)
-        print(f"GLODAlgorithm initialized with alpha={glod.alpha}, jaccard_threshold={glod.jaccard_threshold}")
+        logger.debug("GLODAlgorithm initialized with alpha=%s, jaccard_threshold=%s", glod.alpha, glod.jaccard_threshold)
         
         communities, shen_mod, lazar_mod, nicosia_mod = glod.run(seed_value=42)  # Use fixed seed untuk hasil konsisten
         
@@ -1191,27 +1480,23 @@ def glod_result(request):
         conductance_scores = [glod.calculate_conductance(c) for c in communities]
         avg_conductance = sum(conductance_scores) / len(conductance_scores) if conductance_scores else 0.0
         
-        print(f"Psi Node Cut scores: {psi_scores}")
-        print(f"Average Psi: {avg_psi}")
-        print(f"Conductance scores: {conductance_scores}")
-        print(f"Average Conductance: {avg_conductance}")
+        logger.debug("Psi Node Cut scores: %s", psi_scores)
+        logger.info("Average Psi: %s", avg_psi)
+        logger.debug("Conductance scores: %s", conductance_scores)
+        logger.info("Average Conductance: %s", avg_conductance)
         
         # Format hasil komunitas dengan overlap dan PSI
         community_results = []
         
-        # Hitung nodes yang overlap (ada di multiple communities)
-        node_community_count = {}
-        for community in communities:
-            for node in community:
-                node_community_count[node] = node_community_count.get(node, 0) + 1
+        # Hitung nodes yang overlap (ada di multiple communities); Counter keanggotaan ini
+        # sudah dihitung (dan di-cache) saat run() menghitung modularitas
+        node_community_count = glod._membership_counts()
         
         # Buat dict untuk overlap per komunitas
         overlapping_nodes = set(node for node, count in node_community_count.items() if count > 1)
         
-        for idx, community in enumerate(communities, 1):
-            # Hitung PSI untuk komunitas ini
-            psi_value = glod.calculate_psi_normalized_node_cut(community)
-            
+        # PSI per komunitas sudah dihitung di psi_scores (urutan sama dengan communities)
+        for idx, (community, psi_value) in enumerate(zip(communities, psi_scores), 1):
             # Hitung overlap untuk komunitas ini
             overlap_in_community = community & overlapping_nodes
             
@@ -1245,11 +1530,11 @@ def glod_result(request):
                     nmi_metrics['nmi_lfk'] = round(nmi_results['nmi_lfk'], 4)
                     nmi_metrics['nmi_max'] = round(nmi_results['nmi_max'], 4)
                     nmi_metrics['rnmi'] = round(nmi_results['rnmi'], 4)
-                    print(f"NMI metrics calculated successfully")
+                    logger.info("NMI metrics calculated successfully")
                 else:
-                    print(f"Ground truth data kosong atau tidak valid")
+                    logger.warning("Ground truth data kosong atau tidak valid")
             except Exception as e:
-                print(f"Warning: Gagal menghitung NMI metrics: {str(e)}")
+                logger.warning("Gagal menghitung NMI metrics: %s", e)
         
         # Siapkan data untuk visualisasi
         # Assign warna untuk setiap komunitas
@@ -1316,11 +1601,11 @@ def glod_result(request):
             'alpha': alpha,
             'jaccard_threshold': jaccard_threshold,
             'communities': community_results,
-            'communities_json': json.dumps(community_results),
+            'communities_json': orjson.dumps(community_results, option=orjson.OPT_SERIALIZE_NUMPY).decode(),
             'total_nodes': G.number_of_nodes(),
             'total_edges': G.number_of_edges(),
-            'vis_nodes': json.dumps(vis_nodes),
-            'vis_edges': json.dumps(vis_edges),
+            'vis_nodes': orjson.dumps(vis_nodes).decode(),
+            'vis_edges': orjson.dumps(vis_edges).decode(),
             'color_palette': color_palette[:len(communities)]
         }
         
@@ -1361,48 +1646,54 @@ def download_community_data(request):
         return HttpResponse(f'Error: {str(e)}\n{traceback.format_exc()}', status=500)
 
 
+class _Echo:
+    """Pseudo-buffer untuk csv.writer: write() mengembalikan baris, bukan menyimpannya."""
+    def write(self, value):
+        return value
+
+
 def generate_csv(communities):
-    """Generate CSV file dari data komunitas"""
-    response = HttpResponse(content_type='text/csv; charset=utf-8')
-    response['Content-Disposition'] = f'attachment; filename="hasil_komunitas_glod_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv"'
+    """Generate CSV file dari data komunitas (di-stream baris per baris)"""
+    writer = csv.writer(_Echo())
     
-    # Tulis BOM untuk Excel supaya bisa baca UTF-8
-    response.write('\ufeff')
-    
-    writer = csv.writer(response)
-    
-    # Header
-    writer.writerow([
-        'Komunitas ID',
-        'Jumlah Anggota',
-        'Jumlah Overlap',
-        'Anggota Protein',
-        'Protein Overlap',
-        'Normalized Node Cut (Ψ)'
-    ])
-    
-    # Data dari tabel
-    for community in communities:
-        members_str = ', '.join(community.get('members', []))
-        overlap_members_str = ', '.join(community.get('overlap_members', []))
-        
-        writer.writerow([
-            f"Komunitas {community.get('id', '')}",
-            community.get('size', ''),
-            community.get('overlap_count', ''),
-            members_str,
-            overlap_members_str,
-            community.get('psi', '')
+    def rows():
+        # Tulis BOM untuk Excel supaya bisa baca UTF-8
+        yield '\ufeff'
+        
+        # Header
+        yield writer.writerow([
+            'Komunitas ID',
+            'Jumlah Anggota',
+            'Jumlah Overlap',
+            'Anggota Protein',
+            'Protein Overlap',
+            'Normalized Node Cut (Ψ)'
         ])
+        
+        # Data dari tabel
+        for community in communities:
+            members_str = ', '.join(community.get('members', []))
+            overlap_members_str = ', '.join(community.get('overlap_members', []))
+            
+            yield writer.writerow([
+                f"Komunitas {community.get('id', '')}",
+                community.get('size', ''),
+                community.get('overlap_count', ''),
+                members_str,
+                overlap_members_str,
+                community.get('psi', '')
+            ])
     
+    response = StreamingHttpResponse(rows(), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="hasil_komunitas_glod_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv"'
     return response
 
 
 def generate_xlsx(communities):
     """Generate XLSX file dari data komunitas"""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'Hasil Komunitas'
+    # Mode write_only: baris langsung diserialisasi, tanpa menyimpan objek cell di memori
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Hasil Komunitas')
     
     # Header
     headers = [
@@ -1432,12 +1723,15 @@ def generate_xlsx(communities):
         
         ws.append(data)
     
-    # Create response
-    response = HttpResponse(
+    # Simpan ke file sementara lalu stream; file terhapus otomatis saat FileResponse menutupnya
+    tmp = tempfile.TemporaryFile()
+    wb.save(tmp)
+    tmp.seek(0)
+    
+    return FileResponse(
+        tmp,
+        as_attachment=True,
+        filename=f'hasil_komunitas_glod_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx',
         content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
     )
-    response['Content-Disposition'] = f'attachment; filename="hasil_komunitas_glod_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx"'
-    
-    wb.save(response)
-    return response
 
@@ -1,10 +1,34 @@
 from django.shortcuts import render, redirect
 from django.contrib import messages
-import pandas as pd
+from django.core.cache import caches
+import hashlib
 import logging
+import uuid
+
+from .views_uniprot import get_uniprot_results
 
 logger = logging.getLogger(__name__)
 
+# Dataset preprocessing (list of dict) disimpan di cache 'datasets' (persisten, dipakai bersama
+# semua worker), session hanya menyimpan key-nya. Timeout mengikuti default cache tersebut.
+PREPROCESSING_CACHE_ALIAS = 'datasets'
+
+
+def _preprocessing_cache_key(request) -> str:
+    data_key = request.session.get('preprocessing_data_key')
+    if not data_key:
+        data_key = uuid.uuid4().hex
+        request.session['preprocessing_data_key'] = data_key
+    return f'prep:{data_key}'
+
+
+def _get_preprocessing_data(request) -> list:
+    return caches[PREPROCESSING_CACHE_ALIAS].get(_preprocessing_cache_key(request), [])
+
+
+def _set_preprocessing_data(request, data: list) -> None:
+    caches[PREPROCESSING_CACHE_ALIAS].set(_preprocessing_cache_key(request), data)
+
 # Create your views here.
 
 def preprocessing_index(request):
@@ -17,7 +41,7 @@ def preprocessing_index(request):
     if source == 'search':
         # Data dari hasil pencarian UniProt
         keyword = request.GET.get('q', '')
-        data = request.session.get('uniprot_results', [])
+        data = get_uniprot_results(request)
         data_source = f"Hasil Pencarian UniProt: {keyword}"
     elif source == 'upload':
         # Data dari file upload
@@ -26,7 +50,7 @@ def preprocessing_index(request):
         data_source = f"File Upload: {filename}"
     else:
         # Try to get existing preprocessing data if available
-        data = request.session.get('preprocessing_data', [])
+        data = _get_preprocessing_data(request)
         data_source = request.session.get('preprocessing_source', 'Unknown')
         
         if not data:
@@ -52,9 +76,8 @@ def preprocessing_index(request):
     elif 'preprocessing_original_count' not in request.session:
         request.session['preprocessing_original_count'] = len(data)
 
-    request.session['preprocessing_data'] = data
+    _set_preprocessing_data(request, data)
     request.session['preprocessing_source'] = data_source
-    request.session.modified = True  # Force session save
 
     # Check if duplicates have been removed
     duplicates_removed = request.session.get('preprocessing_duplicates_removed', False)
@@ -93,10 +116,16 @@ def preprocessing_index(request):
     }
 
     # Update session dengan data yang valid dan sudah terurut (sorted by gene_symbol)
-    request.session['preprocessing_data'] = valid_data_sorted
-    # Simpan gene symbol unik ke session dengan nama preprocessing_genes
-    gene_symbols = [row.get('gene_symbol') for row in valid_data_sorted if row.get('gene_symbol')]
-    request.session['preprocessing_genes'] = list(sorted(set(gene_symbols)))
+    _set_preprocessing_data(request, valid_data_sorted)
+    # Simpan gene symbol unik ke session dengan nama preprocessing_genes.
+    # Set + sort hanya diulang jika urutan gene_symbol data berubah (sig berbeda).
+    # Digest deterministik (hash() str di-salt per proses, tidak cocok antar worker/restart)
+    genes_sig = hashlib.blake2b(
+        '\n'.join(str(row.get('gene_symbol') or '') for row in valid_data_sorted).encode(), digest_size=16
+    ).hexdigest()
+    if request.session.get('preprocessing_genes_sig') != genes_sig or 'preprocessing_genes' not in request.session:
+        request.session['preprocessing_genes'] = sorted({gs for row in valid_data_sorted if (gs := row.get('gene_symbol'))})
+        request.session['preprocessing_genes_sig'] = genes_sig
     request.session.modified = True
 
     return render(request, 'glod_app/preprocessing_index.html', context)
@@ -113,7 +142,7 @@ def preprocessing_remove_duplicates(request):
         return redirect('preprocessing_index')
     
     # Get data from session
-    data = request.session.get('preprocessing_data', [])
+    data = _get_preprocessing_data(request)
     
     if not data:
         messages.error(request, 'Tidak ada data untuk diproses.')
@@ -124,25 +153,28 @@ def preprocessing_remove_duplicates(request):
         messages.error(request, 'Format data tidak sesuai untuk penghapusan duplikat.')
         return redirect('preprocessing_index')
 
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
-
-    # Store original count
-    original_count = len(df)
-
-    # Remove duplicates based on gene_symbol
-    if 'gene_symbol' in df.columns:
-        df_unique = df.drop_duplicates(subset=['gene_symbol'], keep='first')
-        removed_count = original_count - len(df_unique)
-        unique_data = df_unique.to_dict('records')
+    original_count = len(data)
+
+    # Remove duplicates based on gene_symbol (keep='first'), satu pass tanpa DataFrame
+    if any('gene_symbol' in row for row in data):
+        seen = set()
+        unique_data = []
+        for row in data:
+            gene_symbol = row.get('gene_symbol')
+            if gene_symbol in seen:
+                continue
+            seen.add(gene_symbol)
+            unique_data.append(row)
+        removed_count = original_count - len(unique_data)
         
         # Update session dengan data yang sudah difilter
-        request.session['preprocessing_data'] = unique_data
+        _set_preprocessing_data(request, unique_data)
         request.session['preprocessing_duplicates_removed'] = True
         
         # PENTING: Update preprocessing_genes dengan data terbaru setelah duplikat dihapus
-        gene_symbols = [row.get('gene_symbol') for row in unique_data if row.get('gene_symbol')]
-        request.session['preprocessing_genes'] = list(sorted(set(gene_symbols)))
+        # set `seen` sudah berisi gene symbol unik, tidak perlu pass kedua
+        request.session['preprocessing_genes'] = sorted(gs for gs in seen if gs)
+        request.session.pop('preprocessing_genes_sig', None)
         
         # PENTING: Reset network_genes agar tidak menggunakan data lama
         # Ini memastikan string_app akan menggunakan preprocessing_genes terbaru
@@ -150,7 +182,7 @@ def preprocessing_remove_duplicates(request):
             del request.session['network_genes']
         
         request.session.modified = True
-        print(f"[DEBUG] remove_duplicates: Updated preprocessing_genes with {len(request.session['preprocessing_genes'])} unique genes")
+        logger.debug("remove_duplicates: Updated preprocessing_genes with %d unique genes", len(request.session['preprocessing_genes']))
         messages.success(request, f'Berhasil menghapus {removed_count} data duplikat. Data sekarang: {len(unique_data)} entries.')
     else:
         messages.error(request, 'Kolom gene_symbol tidak ditemukan pada data. Tidak dapat menghapus duplikat.')
@@ -168,11 +200,12 @@ def preprocessing_reset_data(request):
     
     # Clear preprocessing flags
     request.session['preprocessing_duplicates_removed'] = False
+    request.session.pop('preprocessing_genes_sig', None)
     
     # Determine where to reload data from
     if 'uniprot' in source.lower() or 'pencarian' in source.lower():
         # Reload from uniprot_results
-        original_data = request.session.get('uniprot_results', [])
+        original_data = get_uniprot_results(request)
     elif 'upload' in source.lower() or 'file' in source.lower():
         # Reload from uploaded_gene_data
         original_data = request.session.get('uploaded_gene_data', [])
@@ -182,7 +215,7 @@ def preprocessing_reset_data(request):
     
     if original_data:
         # Reset preprocessing data to original
-        request.session['preprocessing_data'] = original_data
+        _set_preprocessing_data(request, original_data)
         request.session['preprocessing_original_count'] = len(original_data)
         messages.success(request, f'Data berhasil direset ke keadaan semula. Total data: {len(original_data)} entries.')
     else:
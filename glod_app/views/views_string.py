@@ -1,6 +1,14 @@
-import json
+import csv
+import hashlib
+import io
+import orjson
+import logging
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Dict, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Tuple
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.shortcuts import render
 from django.views.decorators.http import require_http_methods
@@ -8,27 +16,67 @@ from django.views.decorators.csrf import csrf_exempt
 from datetime import datetime
 # from ..session_storage import SessionStorage # Uncomment and adjust import if using SessionStorage
 
+logger = logging.getLogger(__name__)
+
 STRING_API_URL = "https://string-db.org/api"
 
+# Satu session untuk semua panggilan STRING: koneksi TCP/TLS ke string-db.org dipakai ulang
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                                       max_retries=Retry(total=2, backoff_factor=0.3)))
+
+_CONFIDENCE_MAP = {
+    "0.900": 900,
+    "0.700": 700,
+    "0.400": 400,
+    "0.150": 150,
+}
+
+# Respons STRING yang sudah di-parse di-cache per (endpoint, parameter, identifiers)
+STRING_CACHE_TIMEOUT = 24 * 60 * 60
+
+def _string_cache_key(kind: str, identifiers: List[str], *params) -> str:
+    digest = hashlib.blake2b('\n'.join(identifiers).encode(), digest_size=16).hexdigest()
+    return f"string:{kind}:{':'.join(map(str, params))}:{digest}"
+
+# Pemisah gene list (baris baru, CR, koma) dinormalisasi ke '\n' dalam satu pass
+_SEP_TRANS = str.maketrans({'\r': '\n', ',': '\n'})
+
+def _split_gene_list(text: str) -> List[str]:
+    return [gene for g in text.translate(_SEP_TRANS).split('\n') if (gene := g.strip())]
+
+# Batas jumlah gene yang dikirim ke STRING per build network
+MAX_NETWORK_GENES = 2000
+
+def _clean_gene_names(genes: List) -> List[str]:
+    # Daftar lengkap (tidak dipotong): disimpan ke session sebagai network_genes, sehingga
+    # original_count dan notifikasi pemotongan tetap benar pada request berikutnya
+    return [name for gene in genes if gene and (name := str(gene).strip())]
+
 def _safe_float(value) -> float:
+    # Skor yang sudah di-parse (mis. di _consolidate_interactions) tidak perlu lewat float() lagi
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except (TypeError, ValueError):
         return 0.0
 
-def _consolidate_interactions(interactions: List[Dict]) -> List[Dict]:
-    edge_map: Dict[tuple, Dict] = {}
-    for it in interactions:
-        p1 = it.get('protein1')
-        p2 = it.get('protein2')
+def _consolidate_interactions(p1s: List[str], p2s: List[str], scores: List[float]) -> Tuple[List[str], List[str], List[float]]:
+    # Kolom paralel (p1, p2, score); edge duplikat A-B / B-A disimpan sekali dengan skor tertinggi
+    edge_map: Dict[tuple, tuple] = {}
+    for p1, p2, score in zip(p1s, p2s, scores):
         if not p1 or not p2:
             continue
-        key = tuple(sorted([p1, p2]))
-        score = _safe_float(it.get('score', 0))
+        key = (p1, p2) if p1 <= p2 else (p2, p1)
+        score = _safe_float(score)
         existing = edge_map.get(key)
-        if existing is None or score > existing['score']:
-            edge_map[key] = {'protein1': p1, 'protein2': p2, 'score': score}
-    return list(edge_map.values())
+        if existing is None or score > existing[2]:
+            edge_map[key] = (p1, p2, score)
+    if not edge_map:
+        return [], [], []
+    out_p1, out_p2, out_scores = map(list, zip(*edge_map.values()))
+    return out_p1, out_p2, out_scores
 
 def _map_string_id_to_gene(string_id: str, id_to_gene_map: Dict[str, List[str]]) -> str:
     if string_id in id_to_gene_map and id_to_gene_map[string_id]:
@@ -39,9 +87,12 @@ def _map_string_id_to_gene(string_id: str, id_to_gene_map: Dict[str, List[str]])
             return parts[1]
     return string_id
 
-def _get_string_ids(gene_names: List[str], species: str = "9606", chunk_size: int = 500, limit: int = 5) -> Dict[str, str]:
-    all_string_ids: Dict[str, str] = {}
-    request_url = f"{STRING_API_URL}/tsv/get_string_ids"
+def _get_string_ids_chunk(request_url: str, gene_names: List[str], species: str, limit: int) -> Dict[str, str]:
+    cache_key = _string_cache_key('ids', gene_names, species, limit)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    string_ids: Dict[str, str] = {}
     params = {
         "identifiers": "\r".join(gene_names),
         "species": species,
@@ -49,25 +100,47 @@ def _get_string_ids(gene_names: List[str], species: str = "9606", chunk_size: in
         "echo_query": 1
     }
     try:
-        response = requests.post(request_url, data=params, timeout=60)
+        response = _SESSION.post(request_url, data=params, timeout=60)
         if response.status_code == 200 and response.text.strip():
-            lines = response.text.strip().splitlines()
-            for line in lines[1:]:
-                if not line.strip():
-                    continue
-                parts = line.split('\t')
+            reader = csv.reader(io.StringIO(response.text), delimiter='\t', quoting=csv.QUOTE_NONE)
+            next(reader, None)  # header
+            for parts in reader:
                 if len(parts) >= 3:
-                    query_name = parts[0].strip()
-                    string_id = parts[2].strip()
-                    if query_name and string_id and query_name not in all_string_ids:
-                        all_string_ids[query_name] = string_id
+                    query_name = parts[0]
+                    string_id = parts[2]
+                    if query_name and string_id and query_name not in string_ids:
+                        string_ids[query_name] = string_id
     except Exception as e:
-        print(f"Terjadi kesalahan saat mendapatkan ID STRING: {e}")
+        logger.error("Terjadi kesalahan saat mendapatkan ID STRING: %s", e)
+    # Hasil kosong (error / timeout) tidak di-cache agar request berikutnya mencoba lagi
+    if string_ids:
+        cache.set(cache_key, string_ids, STRING_CACHE_TIMEOUT)
+    return string_ids
+
+def _get_string_ids(gene_names: List[str], species: str = "9606", chunk_size: int = 500, limit: int = 5) -> Dict[str, str]:
+    all_string_ids: Dict[str, str] = {}
+    request_url = f"{STRING_API_URL}/tsv/get_string_ids"
+    chunks = [gene_names[i:i + chunk_size] for i in range(0, len(gene_names), chunk_size)]
+    # Mapping ID per gene independen antar chunk, jadi chunk bisa dikirim paralel
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = executor.map(lambda chunk: _get_string_ids_chunk(request_url, chunk, species, limit), chunks)
+        # Gabung sesuai urutan chunk agar hasil sama dengan satu POST
+        for chunk_ids in results:
+            for query_name, string_id in chunk_ids.items():
+                all_string_ids.setdefault(query_name, string_id)
     return all_string_ids
 
 def _get_protein_interactions(string_ids: List[str], species: str = "9606", required_score: int = 400,
-                              chunk_size: int = 500, network_type: str = "full") -> List[Dict]:
-    all_interactions: List[Dict] = []
+                              chunk_size: int = 500, network_type: str = "full") -> Tuple[List[str], List[str], List[float]]:
+    # Tidak di-chunk: endpoint network hanya mengembalikan interaksi di dalam satu set identifiers,
+    # sehingga memecah request akan menghilangkan edge antar chunk
+    cache_key = _string_cache_key('network-cols', string_ids, species, required_score, network_type)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    p1s: List[str] = []
+    p2s: List[str] = []
+    scores: List[float] = []
     request_url = f"{STRING_API_URL}/tsv/network"
     params = {
         "identifiers": "\r".join(string_ids),
@@ -76,41 +149,40 @@ def _get_protein_interactions(string_ids: List[str], species: str = "9606", requ
         "network_type": network_type
     }
     try:
-        response = requests.post(request_url, data=params, timeout=120)
+        response = _SESSION.post(request_url, data=params, timeout=120)
         if response.status_code == 200 and response.text.strip():
-            lines = response.text.strip().splitlines()
-            for line in lines[1:]:
-                if not line.strip():
-                    continue
-                parts = line.split('\t')
-                if len(parts) >= 3:
-                    p1 = parts[0].strip()
-                    p2 = parts[1].strip()
-                    score = _safe_float(parts[5])
-                    all_interactions.append({'protein1': p1, 'protein2': p2, 'score': score})
+            reader = csv.reader(io.StringIO(response.text), delimiter='\t', quoting=csv.QUOTE_NONE)
+            next(reader, None)  # header
+            for parts in reader:
+                if len(parts) >= 6:
+                    p1s.append(parts[0])
+                    p2s.append(parts[1])
+                    scores.append(_safe_float(parts[5]))
     except Exception as e:
-        print(f"Terjadi kesalahan saat mendapatkan interaksi: {e}")
-    consolidated = _consolidate_interactions(all_interactions)
+        logger.error("Terjadi kesalahan saat mendapatkan interaksi: %s", e)
+    consolidated = _consolidate_interactions(p1s, p2s, scores)
+    if consolidated[0]:
+        cache.set(cache_key, consolidated, STRING_CACHE_TIMEOUT)
     return consolidated
 
 @require_http_methods(["GET", "POST"])
 def string_network_input(request):
     gene_names: List[str] = []
     
-    print(f"\n[DEBUG] string_network_input called with method: {request.method}")
-    print(f"[DEBUG] POST data: {dict(request.POST)}")
-    print(f"[DEBUG] GET data: {dict(request.GET)}")
-    print(f"[DEBUG] Session keys: {list(request.session.keys())}")
-    print(f"[DEBUG] preprocessing_genes in session: {len(request.session.get('preprocessing_genes', []))} items")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("string_network_input called with method: %s", request.method)
+        logger.debug("POST data: %s", dict(request.POST))
+        logger.debug("GET data: %s", dict(request.GET))
+        logger.debug("Session keys: %s", list(request.session.keys()))
+        logger.debug("preprocessing_genes in session: %d items", len(request.session.get('preprocessing_genes', [])))
     
     if request.method == "POST":
-        post_data = dict(request.POST)
-        print(f"[DEBUG] POST: from_preprocessing={request.POST.get('from_preprocessing')}")
+        logger.debug("POST: from_preprocessing=%s", request.POST.get('from_preprocessing'))
         
         if request.POST.get("from_preprocessing") == "1":
             # ✅ Data dari preprocessing - ambil LANGSUNG dari session
             session_genes = request.session.get('preprocessing_genes', [])
-            print(f"[DEBUG] from_preprocessing=1: Taking from preprocessing_genes ({len(session_genes)} genes)")
+            logger.debug("from_preprocessing=1: Taking from preprocessing_genes (%d genes)", len(session_genes))
         elif request.POST.get("build_network") == "1":
             # Prioritas 1: Ambil dari network_genes (jika sudah pernah di-set)
             session_genes = request.session.get('network_genes')
@@ -118,53 +190,51 @@ def string_network_input(request):
             # Prioritas 2: Jika tidak ada, ambil dari preprocessing_genes (data terbaru setelah duplikat dihapus)
             if not session_genes:
                 session_genes = request.session.get('preprocessing_genes', [])
-                print(f"[DEBUG] build_network=1: network_genes empty, using preprocessing_genes ({len(session_genes)} genes)")
+                logger.debug("build_network=1: network_genes empty, using preprocessing_genes (%d genes)", len(session_genes))
             else:
-                print(f"[DEBUG] build_network=1: Using network_genes ({len(session_genes)} genes)")
+                logger.debug("build_network=1: Using network_genes (%d genes)", len(session_genes))
         else:
             gene_list = request.POST.get("gene_list", "")
             if gene_list:
-                session_genes = [g.strip() for g in gene_list.replace('\r', '\n').replace(',', '\n').split('\n') if g.strip()]
+                session_genes = _split_gene_list(gene_list)
             else:
                 session_genes = []
         
         if session_genes and isinstance(session_genes, list):
-            gene_names = [str(gene).strip() for gene in session_genes if gene and str(gene).strip()]
+            gene_names = _clean_gene_names(session_genes)
         
         if gene_names:
             # Update network_genes ke session untuk tracking
             request.session['network_genes'] = gene_names
-            request.session.save()
-            print(f"[DEBUG] Updated session['network_genes'] with {len(gene_names)} genes")
+            logger.debug("Updated session['network_genes'] with %d genes", len(gene_names))
     else:
         # GET request
-        print(f"[DEBUG] GET request processing...")
+        logger.debug("GET request processing...")
         
         # ✅ PRIORITAS 1: SELALU ambil dari preprocessing_genes dulu (data terbaru dari session)
         if 'preprocessing_genes' in request.session:
             session_genes = request.session.get('preprocessing_genes', [])
             if session_genes and isinstance(session_genes, list):
-                gene_names = [str(gene).strip() for gene in session_genes if gene and str(gene).strip()]
-                print(f"[DEBUG] GET: Using preprocessing_genes from session: {len(gene_names)} genes")
+                gene_names = _clean_gene_names(session_genes)
+                logger.debug("GET: Using preprocessing_genes from session: %d genes", len(gene_names))
         
         # ✅ PRIORITAS 2: Jika tidak ada preprocessing_genes, ambil network_genes
         if not gene_names and 'network_genes' in request.session:
             session_genes = request.session.get('network_genes')
             if session_genes and isinstance(session_genes, list):
-                gene_names = [str(gene).strip() for gene in session_genes if gene and str(gene).strip()]
-                print(f"[DEBUG] GET: Using network_genes from session: {len(gene_names)} genes")
+                gene_names = _clean_gene_names(session_genes)
+                logger.debug("GET: Using network_genes from session: %d genes", len(gene_names))
         
         # ⚠️ PRIORITAS 3 (LAST RESORT): Cek query parameter - HANYA jika tidak ada session data
         if not gene_names:
             genes_param = request.GET.get("genes", "")
             if genes_param:
-                gene_names = [g.strip() for g in genes_param.replace('\r', '\n').replace(',', '\n').split('\n') if g.strip()]
-                print(f"[DEBUG] GET: Using genes query parameter: {len(gene_names)} genes")
-                print(f"[WARNING] Using query parameter instead of session! This might be stale data!")
+                gene_names = _clean_gene_names(_split_gene_list(genes_param))
+                logger.debug("GET: Using genes query parameter: %d genes", len(gene_names))
+                logger.warning("Using query parameter instead of session! This might be stale data!")
                 
                 if gene_names:
                     request.session['network_genes'] = gene_names
-                    request.session.save()
     
     if not gene_names:
         session_genes = request.session.get('preprocessing_genes', [])
@@ -176,7 +246,7 @@ def string_network_input(request):
             sample_genes = session_genes[:3] if hasattr(session_genes, '__getitem__') else 'Cannot sample'
             error_msg += f'Sample data: {sample_genes}'
         
-        print(f"[ERROR] {error_msg}")
+        logger.error("%s", error_msg)
         
         return render(request, 'glod_app/string_input.html', {
             'error': error_msg,
@@ -190,9 +260,10 @@ def string_network_input(request):
             }
         })
     
+    # Batasi jumlah gene yang diproses (hanya saat membangun request, bukan di session)
     original_count = len(gene_names)
-    if len(gene_names) > 2000:
-        gene_names = gene_names[:2000]
+    if original_count > MAX_NETWORK_GENES:
+        gene_names = gene_names[:MAX_NETWORK_GENES]
     
     estimated_minutes = max(1, int(len(gene_names) * 0.003))
     if len(gene_names) > 1000:
@@ -201,13 +272,7 @@ def string_network_input(request):
     selected_confidence = request.POST.get('confidence') or request.GET.get('confidence') or "0.400"
     selected_organism = request.POST.get('organism') or request.GET.get('organism') or "9606"
     
-    confidence_map = {
-        "0.900": 900,
-        "0.700": 700,
-        "0.400": 400,
-        "0.150": 150,
-    }
-    required_score = confidence_map.get(selected_confidence, 400)
+    required_score = _CONFIDENCE_MAP.get(selected_confidence, 400)
     
     context = {
         'gene_names': gene_names,
@@ -229,39 +294,31 @@ def string_network_input(request):
                 context['error'] = 'Tidak dapat menemukan STRING IDs untuk gene yang diberikan'
                 return render(request, 'glod_app/string_input.html', context)
             string_ids = list(string_id_mapping.values())
-            interactions = _get_protein_interactions(
+            proteins1, proteins2, scores = _get_protein_interactions(
                 string_ids, species=selected_organism, required_score=required_score, chunk_size=500, network_type="full"
             )
-            if not interactions:
+            if not proteins1:
                 context['error'] = 'Tidak ditemukan interaksi protein untuk gene yang diberikan'
                 return render(request, 'glod_app/string_input.html', context)
-            nodes = set()
-            edges = []
+            # Semua gene yang ter-mapping selalu jadi node, termasuk yang tanpa interaksi
+            nodes = set(string_id_mapping.keys())
             id_to_gene: Dict[str, List[str]] = {}
             for gene, sid in string_id_mapping.items():
                 id_to_gene.setdefault(sid, []).append(gene)
-            network_interactions = []
-            for interaction in interactions:
-                protein1 = interaction['protein1']
-                protein2 = interaction['protein2']
-                score = interaction.get('score', 0)
-                gene1 = _map_string_id_to_gene(protein1, id_to_gene)
-                gene2 = _map_string_id_to_gene(protein2, id_to_gene)
-                nodes.add(gene1)
-                nodes.add(gene2)
-                edges.append({
-                    'source': gene1,
-                    'target': gene2,
-                    'score': score
-                })
-                network_interactions.append({
-                    'node1': gene1,
-                    'node2': gene2,
-                    'score': score,
-                    'uploaded_at': datetime.now().isoformat()
-                })
-            for mapped_gene in string_id_mapping.keys():
-                nodes.add(mapped_gene)
+            # Resolusi STRING ID -> gene sekali per ID unik, bukan dua kali per edge
+            resolved = {sid: _map_string_id_to_gene(sid, id_to_gene) for sid in set(proteins1).union(proteins2)}
+            sources = [resolved[p] for p in proteins1]
+            targets = [resolved[p] for p in proteins2]
+            nodes.update(sources)
+            nodes.update(targets)
+            # Bentuk dict per edge hanya dibuat di batas serialisasi JSON
+            edges = [{'source': s, 'target': t, 'score': sc} for s, t, sc in zip(sources, targets, scores)]
+            # Satu timestamp untuk seluruh batch interaksi
+            uploaded_at = datetime.now().isoformat()
+            network_interactions = [
+                {'node1': s, 'node2': t, 'score': sc, 'uploaded_at': uploaded_at}
+                for s, t, sc in zip(sources, targets, scores)
+            ]
             network_data = {
                 'nodes': [{'id': node, 'label': node} for node in nodes],
                 'edges': edges
@@ -269,7 +326,7 @@ def string_network_input(request):
             # Uncomment and use storage if needed
             # storage.save_protein_interactions(network_interactions)
             context.update({
-                'network_data': json.dumps(network_data),
+                'network_data': orjson.dumps(network_data).decode(),
                 'total_nodes': len(nodes),
                 'total_edges': len(edges),
                 'mapped_genes': len(string_id_mapping),
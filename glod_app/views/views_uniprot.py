@@ -1,12 +1,27 @@
 from django.http import HttpResponse, HttpResponseBadRequest, JsonResponse
+from django.conf import settings
+from django.core.cache import caches
 from django.shortcuts import render, redirect
+from django.template.loader import get_template
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import etag
 from urllib.parse import urlencode, quote
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
+import csv
+import hashlib
+import importlib.util
+import math
+import os
 import ssl
+import uuid
+from typing import Iterator, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-import pandas as pd
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from openpyxl import Workbook
 import re
 from django.views.decorators.csrf import csrf_exempt
 import logging
@@ -16,6 +31,9 @@ ssl_context = ssl.create_default_context()
 
 logger = logging.getLogger(__name__)
 
+_LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+_FILENAME_SANITIZE_RE = re.compile(r'[^a-z0-9]+')
+
 
 def index(request):
     """Redirect to Input Data Gen page for convenience."""
@@ -61,27 +79,61 @@ def _get_next_link(headers):
     if not link:
         return None
     # Parse Link header: <url>; rel="next"
-    import re
-    m = re.match(r'<([^>]+)>;\s*rel="next"', link)
-    if m:
-        return m.group(1)
-    return None
+    m = _LINK_NEXT_RE.match(link)
+    return m.group(1) if m else None
+
+
+# Satu session untuk semua halaman UniProt: koneksi TLS ke rest.uniprot.org dipakai ulang.
+# Retry (dengan backoff, menghormati Retry-After) hanya untuk 429 dan error 5xx sementara;
+# jika tetap gagal, response terakhir dikembalikan dan ditangani sebagai API error.
+# Accept-Encoding ditulis eksplisit: JSON halaman UniProt dikirim gzip (jauh lebih kecil),
+# dan requests men-dekompres otomatis.
+_HTTP = requests.Session()
+_HTTP.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip, deflate"})
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(
+    total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False,
+)))
+
+
+# Halaman UniProt yang identik (query, size, cursor sama) dalam waktu singkat diambil dari cache,
+# jadi pencarian ulang / refresh tidak memukul API lagi. Hanya response 200 yang disimpan.
+# Halaman (bisa beberapa MB) punya cache sendiri dengan MAX_ENTRIES kecil, agar tidak
+# menggusur entri cache lain; timeout (5 menit) mengikuti setting alias tersebut.
+UNIPROT_PAGE_CACHE_ALIAS = 'uniprot_pages'
+
+
+class _UniProtPage(NamedTuple):
+    """Pengganti ringan requests.Response untuk halaman yang diambil dari cache."""
+    status_code: int
+    content: bytes
+    headers: dict
+
+
+def _page_cache_key(query, size, cursor_url) -> str:
+    digest = hashlib.blake2b(f"{query}\x1f{size}\x1f{cursor_url or ''}".encode("utf-8"), digest_size=16)
+    return f"uniprot:page:{digest.hexdigest()}"
 
 
 # Helper function to fetch a single page of results
 def _fetch_page(query, size, cursor_url, email="contact@example.org"):
     """
-    Fetch page from UniProt API.
-    Returns: (Response object, next_link)
+    Fetch page from UniProt API (atau dari cache halaman jika masih segar).
+    Returns: (Response-like object, next_link)
     """
+    page_key = _page_cache_key(query, size, cursor_url)
+    cached = caches[UNIPROT_PAGE_CACHE_ALIAS].get(page_key)
+    if cached is not None:
+        content, total, next_link = cached
+        headers = {"x-total-results": total} if total is not None else {}
+        return _UniProtPage(200, content, headers), next_link
+
     headers = {
         "User-Agent": f"webta-uniprot/1.0 (contact: {email})",
-        "Accept": "application/json",
     }
     
     if cursor_url:
         # Use cursor URL directly for subsequent pages
-        resp = requests.get(cursor_url, headers=headers, timeout=60)
+        resp = _HTTP.get(cursor_url, headers=headers, timeout=60)
     else:
         # First page: build query with explicit fields
         base_url = "https://rest.uniprot.org/uniprotkb/search"
@@ -89,20 +141,21 @@ def _fetch_page(query, size, cursor_url, email="contact@example.org"):
             "query": query,
             "format": "json",
             "size": str(size),
-            # Explicitly request all fields we need
-            "fields": "accession,id,protein_name,gene_names,gene_primary,organism_name,reviewed",
+            # Explicitly request all fields we need (hanya yang dibaca _iter_entries)
+            "fields": "accession,id,protein_name,gene_names,gene_primary,organism_name",
         }
-        resp = requests.get(base_url, params=params, headers=headers, timeout=60)
+        resp = _HTTP.get(base_url, params=params, headers=headers, timeout=60)
     
     if resp.status_code != 200:
         raise Exception(f"API error: {resp.status_code} - {resp.text}")
     
     next_link = _get_next_link(resp.headers)
+    caches[UNIPROT_PAGE_CACHE_ALIAS].set(page_key, (resp.content, resp.headers.get("x-total-results"), next_link))
     return resp, next_link
 
 
 # Helper function to extract protein name
-def _extract_protein_name(entry):
+def _extract_protein_name(entry: dict) -> str | None:
     """
     Extract protein name with comprehensive fallback strategies.
     Handles all variations from UniProt API response.
@@ -110,56 +163,62 @@ def _extract_protein_name(entry):
     protein_desc = entry.get("proteinDescription", {})
     
     # Strategy 1: recommendedName
+    # (nilai yang dicek berulang di tiap cabang di-bind ke variabel lokal: satu lookup dict saja)
     if "recommendedName" in protein_desc:
         rec_name = protein_desc["recommendedName"]
         if "fullName" in rec_name:
-            if isinstance(rec_name["fullName"], dict):
-                name = rec_name["fullName"].get("value")
+            full_name = rec_name["fullName"]
+            if isinstance(full_name, dict):
+                name = full_name.get("value")
                 if name:
                     return name
-            elif isinstance(rec_name["fullName"], str):
-                return rec_name["fullName"]
+            elif isinstance(full_name, str):
+                return full_name
         # Also try shortName
         if "shortName" in rec_name:
-            if isinstance(rec_name["shortName"], list) and rec_name["shortName"]:
-                short = rec_name["shortName"][0]
+            short_name = rec_name["shortName"]
+            if isinstance(short_name, list) and short_name:
+                short = short_name[0]
                 if isinstance(short, dict):
                     name = short.get("value")
                     if name:
                         return name
-            elif isinstance(rec_name["shortName"], dict):
-                name = rec_name["shortName"].get("value")
+            elif isinstance(short_name, dict):
+                name = short_name.get("value")
                 if name:
                     return name
     
     # Strategy 2: submittedName
-    if "submittedName" in protein_desc and protein_desc["submittedName"]:
-        submitted_list = protein_desc["submittedName"] if isinstance(protein_desc["submittedName"], list) else [protein_desc["submittedName"]]
-        for submitted in submitted_list:
+    submitted_names = protein_desc.get("submittedName")
+    if submitted_names:
+        for submitted in (submitted_names if isinstance(submitted_names, list) else [submitted_names]):
             if "fullName" in submitted:
-                if isinstance(submitted["fullName"], dict):
-                    name = submitted["fullName"].get("value")
+                full_name = submitted["fullName"]
+                if isinstance(full_name, dict):
+                    name = full_name.get("value")
                     if name:
                         return name
-                elif isinstance(submitted["fullName"], str):
-                    return submitted["fullName"]
+                elif isinstance(full_name, str):
+                    return full_name
     
     # Strategy 3: alternativeName
-    if "alternativeName" in protein_desc and protein_desc["alternativeName"]:
-        alt_list = protein_desc["alternativeName"] if isinstance(protein_desc["alternativeName"], list) else [protein_desc["alternativeName"]]
-        for alt_name in alt_list:
+    alt_names = protein_desc.get("alternativeName")
+    if alt_names:
+        for alt_name in (alt_names if isinstance(alt_names, list) else [alt_names]):
             if "fullName" in alt_name:
-                if isinstance(alt_name["fullName"], dict):
-                    name = alt_name["fullName"].get("value")
+                full_name = alt_name["fullName"]
+                if isinstance(full_name, dict):
+                    name = full_name.get("value")
                     if name:
                         return name
-                elif isinstance(alt_name["fullName"], str):
-                    return alt_name["fullName"]
+                elif isinstance(full_name, str):
+                    return full_name
     
     # Strategy 4: Direct protein field (some API responses)
     if "protein" in entry:
-        if isinstance(entry["protein"], dict) and "recommendedName" in entry["protein"]:
-            return entry["protein"]["recommendedName"].get("fullName", {}).get("value")
+        protein = entry["protein"]
+        if isinstance(protein, dict) and "recommendedName" in protein:
+            return protein["recommendedName"].get("fullName", {}).get("value")
     
     # Strategy 5: Fall back to uniProtkbId parsing (last resort)
     # Example: "BRMS1_HUMAN" → extract "BRMS1"
@@ -173,7 +232,7 @@ def _extract_protein_name(entry):
 
 
 # Helper function to extract gene symbol
-def _extract_gene_symbol(entry):
+def _extract_gene_symbol(entry: dict) -> str | None:
     """
     Extract gene symbol with comprehensive fallback strategies.
     Handles all variations from UniProt API response.
@@ -194,8 +253,9 @@ def _extract_gene_symbol(entry):
                 return gene_name
         
         # Try synonyms
-        if "synonyms" in gene and gene["synonyms"]:
-            synonym = gene["synonyms"][0] if isinstance(gene["synonyms"], list) else gene["synonyms"]
+        synonyms = gene.get("synonyms")
+        if synonyms:
+            synonym = synonyms[0] if isinstance(synonyms, list) else synonyms
             if isinstance(synonym, dict):
                 name = synonym.get("value")
                 if name:
@@ -204,8 +264,9 @@ def _extract_gene_symbol(entry):
                 return synonym
         
         # Try orfNames
-        if "orfNames" in gene and gene["orfNames"]:
-            orf = gene["orfNames"][0] if isinstance(gene["orfNames"], list) else gene["orfNames"]
+        orf_names = gene.get("orfNames")
+        if orf_names:
+            orf = orf_names[0] if isinstance(orf_names, list) else orf_names
             if isinstance(orf, dict):
                 name = orf.get("value")
                 if name:
@@ -214,8 +275,9 @@ def _extract_gene_symbol(entry):
                 return orf
         
         # Try orderedLocusNames
-        if "orderedLocusNames" in gene and gene["orderedLocusNames"]:
-            locus = gene["orderedLocusNames"][0] if isinstance(gene["orderedLocusNames"], list) else gene["orderedLocusNames"]
+        locus_names = gene.get("orderedLocusNames")
+        if locus_names:
+            locus = locus_names[0] if isinstance(locus_names, list) else locus_names
             if isinstance(locus, dict):
                 name = locus.get("value")
                 if name:
@@ -225,12 +287,13 @@ def _extract_gene_symbol(entry):
     
     # Strategy 2: Direct gene field (some API responses)
     if "gene" in entry:
-        if isinstance(entry["gene"], dict):
-            name = entry["gene"].get("name") or entry["gene"].get("value")
+        gene_field = entry["gene"]
+        if isinstance(gene_field, dict):
+            name = gene_field.get("name") or gene_field.get("value")
             if name:
                 return name
-        elif isinstance(entry["gene"], str):
-            return entry["gene"]
+        elif isinstance(gene_field, str):
+            return gene_field
     
     # Strategy 3: Extract from uniProtkbId
     # Example: "BRMS1_HUMAN" → extract "BRMS1"
@@ -252,18 +315,17 @@ def _extract_gene_symbol(entry):
 
 
 # Helper function to normalize entries from Response object
-def _normalize_entries(resp):
+def _iter_entries(resp) -> Iterator[dict]:
     """
     Normalize entries from requests.Response object.
-    Returns list of dicts matching template keys (Accession, ProteinName, etc).
+    Yields dicts matching template keys (Accession, ProteinName, etc), satu per entry.
     Handles both nested (proteinDescription) and flat (protein_name) field formats.
     """
     try:
-        data = resp.json()
+        data = orjson.loads(resp.content)
     except Exception:
-        return []
+        return
     
-    normalized = []
     for entry in data.get("results", []):
         # Extract Accession (primary key)
         accession = entry.get("primaryAccession") or entry.get("accession") or ""
@@ -271,6 +333,10 @@ def _normalize_entries(resp):
         # Extract Entry ID
         entry_id = entry.get("uniProtkbId") or entry.get("id") or ""
         
+        # Don't add if critical fields are missing (cek di awal: fallback nama/gen tidak dikerjakan percuma)
+        if not accession and not entry_id:
+            continue
+        
         # Extract Protein Name
         # Strategy 1: Check if API returned flat field (when fields=protein_name)
         protein_name = None
@@ -331,21 +397,66 @@ def _normalize_entries(resp):
             elif isinstance(org, str):
                 organism = org
         
-        # Don't add if critical fields are missing
-        if not accession and not entry_id:
-            continue
-        
-        normalized.append({
-            "accession": accession or "",
-            "entry_id": entry_id or "",
+        yield {
+            "accession": accession,
+            "entry_id": entry_id,
             "protein_name": protein_name or "",
             "gene_symbol": gene_symbol or "",
             "organism": organism or "",
-        })
-    return normalized
+        }
+
+
+# Hasil pencarian UniProt disimpan di cache 'datasets' (persisten, dipakai bersama semua worker,
+# terpisah dari cache halaman API); session hanya menyimpan key-nya.
+# Disimpan kolomnar (satu list per field, di-encode orjson) agar key tidak diulang per baris.
+UNIPROT_RESULTS_CACHE_ALIAS = 'datasets'
+_UNIPROT_RESULT_FIELDS = ("accession", "entry_id", "protein_name", "gene_symbol", "organism")
+
+
+def _uniprot_results_cache_key(results_key: str) -> str:
+    return f'uniprot:{results_key}'
+
+
+def get_uniprot_results(request) -> list:
+    """Ambil hasil pencarian UniProt terakhir milik session ini (list kosong jika tidak ada/expired)."""
+    # Hanya membaca: session tanpa pencarian sebelumnya tidak diberi key (tidak ditandai modified)
+    results_key = request.session.get('uniprot_results_key')
+    if not results_key:
+        return []
+    packed = caches[UNIPROT_RESULTS_CACHE_ALIAS].get(_uniprot_results_cache_key(results_key))
+    if not packed:
+        return []
+    columns = orjson.loads(packed)
+    return [dict(zip(_UNIPROT_RESULT_FIELDS, values))
+            for values in zip(*(columns[field] for field in _UNIPROT_RESULT_FIELDS))]
+
+
+def _store_uniprot_results(request, results: list) -> None:
+    results_key = request.session.get('uniprot_results_key')
+    if not results_key:
+        results_key = uuid.uuid4().hex
+        request.session['uniprot_results_key'] = results_key
+    columns = {field: [row.get(field, "") for row in results] for field in _UNIPROT_RESULT_FIELDS}
+    caches[UNIPROT_RESULTS_CACHE_ALIAS].set(_uniprot_results_cache_key(results_key), orjson.dumps(columns))
+
+
+_INPUT_PAGE_TEMPLATES = ('glod_app/uniprot_input_data_gen.html', 'base.html')
+
+
+def _input_page_etag(request):
+    """
+    ETag halaman Input Data Gen untuk GET: berubah jika template berubah atau cookie CSRF
+    berganti (token di form harus tetap valid saat browser memakai salinan cache / 304).
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    mtimes = ':'.join(str(os.path.getmtime(get_template(name).origin.name)) for name in _INPUT_PAGE_TEMPLATES)
+    csrf_cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME, '')
+    return hashlib.md5(f"{mtimes}:{csrf_cookie}".encode()).hexdigest()
 
 
 @csrf_exempt
+@etag(_input_page_etag)
 def uniprot_search(request):
     """
     UniProt search - Fetch ALL results in one page (no pagination).
@@ -369,56 +480,87 @@ def uniprot_search(request):
             try:
                 logger.info(f"Searching for: {keyword}")
                 
-                # Fetch ALL data dengan looping otomatis
-                next_cursor = None
+                # Fetch ALL data dengan looping otomatis.
+                # Halaman berikutnya (cursor dari Link header) sudah di-request di background
+                # selagi halaman saat ini di-normalize.
+                resp, next_cursor = _fetch_page(query, DEFAULT_PAGE_SIZE, None, "contact@example.org")
                 
-                while True:
-                    # Fetch page
-                    resp, next_cursor = _fetch_page(query, DEFAULT_PAGE_SIZE, next_cursor, "contact@example.org")
-                    
-                    if resp.status_code != 200:
-                        error = f"UniProt API error: HTTP {resp.status_code}"
-                        break
-                    
-                    # Normalize dan tambahkan ke results
-                    page_results = _normalize_entries(resp)
-                    results.extend(page_results)
-                    
-                    # Ambil total dari header (hanya sekali)
-                    if total_results == 0:
-                        total_str = resp.headers.get("x-total-results")
-                        if total_str:
-                            try:
-                                total_results = int(total_str)
-                            except Exception:
-                                pass
-                    
-                    logger.info(f"Fetched {len(page_results)} results. Total so far: {len(results)}")
-                    
-                    # Stop jika tidak ada next link
-                    if not next_cursor:
-                        break
-                    
-                    # Sleep sebentar untuk menghindari rate limiting
-                    time.sleep(0.3)
+                # Ambil total dari header halaman pertama (hanya sekali)
+                total_str = resp.headers.get("x-total-results")
+                if total_str:
+                    try:
+                        total_results = int(total_str)
+                    except Exception:
+                        pass
+                
+                # Tidak ada hit: halaman kosong tidak perlu di-parse / di-prefetch
+                no_hits = total_str is not None and total_results == 0
+                seen = set()
+                
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    while not no_hits:
+                        if resp.status_code != 200:
+                            error = f"UniProt API error: HTTP {resp.status_code}"
+                            break
+                        
+                        next_page = None
+                        if next_cursor:
+                            next_page = executor.submit(_fetch_page, query, DEFAULT_PAGE_SIZE, next_cursor, "contact@example.org")
+                        
+                        # Normalize dan tambahkan ke results langsung dari generator.
+                        # Entry yang accession-nya sudah muncul di halaman sebelumnya dilewati
+                        # (entry tanpa accession selalu disimpan).
+                        fetched_before = len(results)
+                        for row in _iter_entries(resp):
+                            accession = row["accession"]
+                            if accession:
+                                if accession in seen:
+                                    continue
+                                seen.add(accession)
+                            results.append(row)
+                        
+                        logger.info(f"Fetched {len(results) - fetched_before} results. Total so far: {len(results)}")
+                        
+                        # Stop jika tidak ada next link
+                        if next_page is None:
+                            break
+                        
+                        resp, next_cursor = next_page.result()
                 
                 logger.info(f"Completed! Total fetched: {len(results)} out of {total_results}")
                 
                 # Simpan hasil ke session untuk download
-                request.session['uniprot_results'] = results
+                _store_uniprot_results(request, results)
                 request.session['uniprot_keyword'] = keyword
-                request.session.modified = True  # Force session save
                 
             except Exception as e:
                 logger.error(f"Error fetching data: {str(e)}")
                 error = f"Terjadi kesalahan: {str(e)}"
     
-    return render(request, "glod_app/uniprot_input_data_gen.html", {
+    response = render(request, "glod_app/uniprot_input_data_gen.html", {
         "results": results,
         "total_results": total_results,
         "error": error,
         "keyword": keyword,
     })
+    if request.method == "POST":
+        # Hasil pencarian boleh dipakai ulang browser sebentar (mis. submit ganda / back)
+        patch_cache_control(response, private=True, max_age=60)
+    return response
+
+
+def _is_missing(value) -> bool:
+    # None / NaN (mis. sel kosong dari file upload) ditulis kosong, seperti DataFrame.to_csv/to_excel
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _csv_cell(value):
+    return '' if _is_missing(value) else value
+
+
+def _download_fieldnames(data: list) -> list:
+    # Kolom = gabungan key semua baris sesuai urutan kemunculan (sama seperti DataFrame)
+    return list(dict.fromkeys(key for row in data for key in row))
 
 
 def uniprot_download(request):
@@ -434,32 +576,46 @@ def uniprot_download(request):
         data = request.session.get("uploaded_gene_data", [])
         filename_base = request.session.get("uploaded_filename", "uploaded_data").replace('.', '_')
     else:
-        data = request.session.get("uniprot_results", [])
-        filename_base = re.sub(r'[^a-z0-9]+', '_', keyword.lower()).strip('_') or 'uniprot'
+        data = get_uniprot_results(request)
+        filename_base = _FILENAME_SANITIZE_RE.sub('_', keyword.lower()).strip('_') or 'uniprot'
 
     if not data:
         return JsonResponse({"error": "Tidak ada data untuk diunduh. Silakan lakukan pencarian atau upload terlebih dahulu."}, status=400)
 
-    df = pd.DataFrame(data)
+    fieldnames = _download_fieldnames(data)
     
     if file_type == "excel":
         response = HttpResponse(content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
         response["Content-Disposition"] = f'attachment; filename="{filename_base}_results.xlsx"'
-        with pd.ExcelWriter(response, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False, sheet_name='Results')
+        # Mode write_only: baris langsung diserialisasi tanpa objek cell per sel di memori
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet('Results')
+        ws.append(fieldnames)
+        for row in data:
+            ws.append([None if _is_missing(value := row.get(key)) else value for key in fieldnames])
+        wb.save(response)
         return response
     else:  # Default to CSV
         response = HttpResponse(content_type="text/csv")
         response["Content-Disposition"] = f'attachment; filename="{filename_base}_results.csv"'
-        df.to_csv(response, index=False)
+        writer = csv.writer(response, lineterminator='\n')
+        writer.writerow(fieldnames)
+        writer.writerows([_csv_cell(row.get(key)) for key in fieldnames] for row in data)
         return response
 
 
+@etag(_input_page_etag)
 def uniprot_input_data_gen(request):
     """Render the Input Data Gen page."""
     return render(request, 'glod_app/uniprot_input_data_gen.html')
 
 
+# Parser upload: pakai engine native yang lebih cepat jika terpasang (pyarrow untuk CSV/TXT,
+# python-calamine untuk Excel), selain itu default pandas. dtype tetap numpy agar isi session sama.
+_CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+_EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else None
+
+
 def uniprot_upload(request):
     """
     Handle file upload for manual gene list input.
@@ -485,19 +641,23 @@ def uniprot_upload(request):
             'upload_error': f'Format file tidak didukung: .{file_ext}. Gunakan .csv, .xlsx, .xls, atau .txt'
         })
     
+    # pandas hanya dibutuhkan untuk membaca file upload; di-import di sini agar search/download
+    # dan startup modul tidak menanggung biaya import-nya
+    import pandas as pd
+    
     try:
         # Read file based on extension
         if file_ext in ['xlsx', 'xls']:
-            df = pd.read_excel(uploaded_file)
+            df = pd.read_excel(uploaded_file, engine=_EXCEL_ENGINE)
         elif file_ext == 'csv':
-            df = pd.read_csv(uploaded_file)
+            df = pd.read_csv(uploaded_file, engine=_CSV_ENGINE)
         elif file_ext == 'txt':
             # Try to read as tab-separated or comma-separated
             try:
-                df = pd.read_csv(uploaded_file, sep='\t')
+                df = pd.read_csv(uploaded_file, sep='\t', engine=_CSV_ENGINE)
             except:
                 uploaded_file.seek(0)  # Reset file pointer
-                df = pd.read_csv(uploaded_file)
+                df = pd.read_csv(uploaded_file, engine=_CSV_ENGINE)
         
         # Validate dataframe
         if df.empty:
@@ -527,11 +687,12 @@ def uniprot_upload(request):
         # Apply column mapping
         df.columns = [column_mapping.get(col, col) for col in df.columns]
         
-        # Count valid rows (non-empty rows)
-        valid_rows = df.dropna(how='all').shape[0]
+        # Count valid rows (non-empty rows) - satu pass vektor tanpa membuat DataFrame terfilter
+        valid_rows = int(df.notna().any(axis=1).sum())
         
-        # Convert to list of dicts for template
-        uploaded_data = df.to_dict('records')
+        # Convert to list of dicts for template (itertuples + zip, lebih ringan dari to_dict('records'))
+        columns = list(df.columns)
+        uploaded_data = [dict(zip(columns, row)) for row in df.itertuples(index=False, name=None)]
         
         # Store in session
         request.session['uploaded_gene_data'] = uploaded_data
@@ -544,7 +705,7 @@ def uniprot_upload(request):
             'filesize': filesize_str,
             'total_rows': len(df),
             'valid_rows': valid_rows,
-            'columns': list(df.columns),
+            'columns': columns,
         }
         
         return render(request, 'glod_app/uniprot_input_data_gen.html', {
@@ -83,6 +83,56 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# default: cache lokal per proses untuk respons API yang berumur pendek (STRING).
+# uniprot_pages: halaman mentah UniProt (bisa beberapa MB per entri), dibatasi tersendiri.
+# datasets: dataset milik session (hasil pencarian UniProt, data preprocessing) disimpan di file
+# agar terbaca dari worker mana pun, bertahan saat restart, dan tidak tergusur cache respons API.
+# sessions: cache untuk engine cached_db, juga berbasis file agar semua worker melihat versi yang sama.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'uniprot_pages': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'uniprot_pages',
+        'TIMEOUT': 5 * 60,
+        'OPTIONS': {
+            'MAX_ENTRIES': 40,  # ~20.000 hasil dengan ukuran halaman 500
+        },
+    },
+    'datasets': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.django_cache' / 'datasets',
+        'TIMEOUT': 14 * 24 * 60 * 60,  # Sama dengan umur cookie session (SESSION_COOKIE_AGE default)
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+    'sessions': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.django_cache' / 'sessions',
+        'TIMEOUT': 14 * 24 * 60 * 60,  # Sama dengan umur cookie session (SESSION_COOKIE_AGE default)
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+}
+
+
+# Sessions
+# https://docs.djangoproject.com/en/5.2/topics/http/sessions/#session-serialization
+
+# cached_db: session dibaca dari cache (tanpa query DB per request), tetap ditulis ke DB.
+# Cache-nya harus lintas proses: dengan LocMemCache tiap worker menyimpan salinan sendiri
+# dan bisa menimpa tulisan worker lain dengan versi session yang sudah basi.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'sessions'
+SESSION_SERIALIZER = 'glod_app.session_serializers.OrjsonSerializer'
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 